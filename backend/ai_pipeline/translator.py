@@ -5,11 +5,6 @@ Uses MultilingualProcessor for IndicTrans2 and Google Translate fallback
 
 import logging
 from typing import Optional
-import sys
-from pathlib import Path
-
-# Add app directory to path to import language_processor
-sys.path.insert(0, str(Path(__file__).parent.parent / 'app'))
 
 logger = logging.getLogger(__name__)
 
@@ -28,11 +23,11 @@ class IndianLanguageTranslator:
     
     @property
     def processor(self):
-        """Lazy load MultilingualProcessor"""
+        """Lazy load the shared MultilingualProcessor (one IndicTrans2 copy per process)"""
         if self._processor is None:
             try:
-                from language_processor import MultilingualProcessor
-                self._processor = MultilingualProcessor()
+                from app.language_processor import get_language_processor
+                self._processor = get_language_processor()
                 logger.info("MultilingualProcessor loaded successfully")
             except Exception as e:
                 logger.error(f"Failed to load MultilingualProcessor: {e}")
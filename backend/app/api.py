@@ -14,7 +14,7 @@ logger = logging.getLogger(__name__)
 from .config import settings
 from .database import get_database, User, NewsFeedback, SystemSettings, PIBAlert, Article
 from .schemas import (
-    NewsListResponse, ArticleOut,
+    NewsListResponse, ArticleOut, ArticleSummaryOut, LatestNewsResponse,
     UserLogin, TokenResponse, UserCreate, UserUpdate, UserOut, UserChangePassword,
     FeedbackCreate, FeedbackUpdate, FeedbackOut,
     SettingCreate, SettingUpdate, SettingOut,
@@ -306,7 +306,6 @@ async def update_feedback(
         
         feedback.updated_at = datetime.utcnow()
         session.commit()
-        session.refresh(feedback)
         
         return FeedbackOut.model_validate(feedback)
 
@@ -429,7 +428,6 @@ async def update_setting(
         
         setting.updated_at = datetime.utcnow()
         session.commit()
-        session.refresh(setting)
         
         return SettingOut.model_validate(setting)
 
@@ -766,9 +764,6 @@ async def list_news(
     try:
         import re
         
-        # Log all incoming filter parameters
-        logger.info(f"[/news API] Incoming filters: limit={limit}, offset={offset}, sentiment={sentiment}, region={region}, category={category}, source={source}, language={language}, q={q}, goi_only={goi_only}")
-        
         # Show ALL articles (no date filter) unless user specifies
         # date_from is only set if user explicitly provides it
         
@@ -787,7 +782,7 @@ async def list_news(
             goi_only=goi_only,
         )
         
-        logger.info(f"[/news API] Query returned {len(items)} items out of {total} total")
+        logger.debug("[/news API] Query returned %d items out of %d total", len(items), total)
         
         cleaned_items = []
         
@@ -813,35 +808,35 @@ async def list_news(
         return NewsListResponse(items=[], total=0)
 
 
-@router.get("/news/latest")
+@router.get("/news/latest", response_model=LatestNewsResponse)
 async def latest_news(
     limit: int = Query(10, ge=1, le=50),
     db = Depends(get_db),
 ):
     """Get the most recent news articles (for real-time monitoring)."""
     try:
-        items, total = db.list_articles(limit=limit, offset=0)
-        
-        # Convert to dicts
+        # Summary fields only - this feed never renders content or entities
         if settings.DB_PROVIDER.lower() == "mongodb":
-            return {
-                "items": [ArticleOut.model_validate(i).model_dump() for i in items],
-                "total": total,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            items, total = db.list_articles(limit=limit, offset=0)
         else:
-            return {
-                "items": [ArticleOut.model_validate(i).model_dump() for i in items],
-                "total": total,
-                "timestamp": datetime.utcnow().isoformat(),
-            }
+            items, total = db.list_articles_summary(limit=limit, offset=0)
+        return LatestNewsResponse(
+            items=[ArticleSummaryOut.model_validate(i) for i in items],
+            total=total,
+            timestamp=datetime.utcnow().isoformat(),
+        )
     except Exception as e:
         # If database is not available, return empty list for development
-        return {
-            "items": [],
-            "total": 0,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
+        return LatestNewsResponse(items=[], total=0, timestamp=datetime.utcnow().isoformat())
+
+
+@router.get("/news/{article_id}", response_model=ArticleOut)
+async def get_news_article(article_id: str, db = Depends(get_db)):
+    """Get a single article with full content and entities."""
+    article = db.get_article_detail(article_id)
+    if not article:
+        raise HTTPException(status_code=404, detail="Article not found")
+    return ArticleOut.model_validate(article)
 
 
 @router.post("/collect")
@@ -865,27 +860,7 @@ async def analytics_sentiment(db = Depends(get_db)):
 @router.get("/analytics/category")
 async def analytics_category(db = Depends(get_db)):
     try:
-        from .database import Article
-        from sqlalchemy import func
-        with db.get_session() as session:
-            # Get topic counts for Government category only
-            topic_counts = {}
-            query = session.query(Article.topic_labels).filter(
-                Article.topic_labels.isnot(None),
-                Article.should_show_pib == True,
-                Article.content_category == 'Government'
-            )
-            
-            articles_with_topics = query.limit(1000).all()
-            for (topics,) in articles_with_topics:
-                if topics:
-                    for topic in topics:
-                        topic_counts[topic] = topic_counts.get(topic, 0) + 1
-            
-            return [
-                {"category": cat, "count": count}
-                for cat, count in sorted(topic_counts.items(), key=lambda x: x[1], reverse=True)
-            ]
+        return db.analytics_category()
     except Exception as e:
         return []
 
@@ -993,51 +968,20 @@ async def analytics_scripts(db = Depends(get_db)):
 async def analytics_content_classification(db = Depends(get_db)):
     """Get content classification statistics."""
     try:
-        from .database import Article
-        from sqlalchemy import func
-        with db.get_session() as session:
-            # Total articles
-            total = session.query(func.count(Article.id)).scalar() or 0
-            
-            # By category
-            by_category = session.query(
-                Article.content_category,
-                func.count(Article.id).label("count")
-            ).filter(Article.content_category.isnot(None)).group_by(
-                Article.content_category
-            ).order_by(func.count(Article.id).desc()).all()
-            
-            # Shown vs Filtered
-            shown = session.query(func.count(Article.id)).filter(
-                Article.should_show_pib == True
-            ).scalar() or 0
-            
-            filtered = session.query(func.count(Article.id)).filter(
-                Article.should_show_pib == False
-            ).scalar() or 0
-            
-            # Filtered breakdown
-            filtered_breakdown = session.query(
-                Article.content_category,
-                func.count(Article.id).label("count")
-            ).filter(
-                Article.should_show_pib == False,
-                Article.content_category.isnot(None)
-            ).group_by(Article.content_category).all()
-            
-            return {
-                "total": total,
-                "shown": shown,
-                "filtered": filtered,
-                "by_category": [
-                    {"category": cat or "Unknown", "count": count}
-                    for cat, count in by_category
-                ],
-                "filtered_breakdown": [
-                    {"category": cat or "Unknown", "count": count}
-                    for cat, count in filtered_breakdown
-                ]
-            }
+        stats = db.filter_statistics()
+        return {
+            "total": stats["total"],
+            "shown": stats["shown"],
+            "filtered": stats["filtered"],
+            "by_category": [
+                {"category": cat, "count": count}
+                for cat, count in sorted(stats["by_category"].items(), key=lambda x: x[1], reverse=True)
+            ],
+            "filtered_breakdown": [
+                {"category": cat, "count": count}
+                for cat, count in stats["filtered_breakdown"].items()
+            ]
+        }
     except Exception as e:
         return {
             "total": 0,
@@ -1616,7 +1560,6 @@ async def mark_alert_reviewed(
             alert.reviewed_by = None
         
         session.commit()
-        session.refresh(alert)
         
         return PIBAlertOut.model_validate(alert)
 
@@ -7,6 +7,7 @@ Date: December 23, 2025
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import JSONResponse, ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
@@ -21,6 +22,15 @@ from .geo_intelligence import get_geo_intelligence
 
 router = APIRouter(prefix="/assistant", tags=["assistant"])
 
+# The geo endpoints return plain JSON-native dicts, so they are rendered
+# directly (with orjson when installed) instead of going through
+# FastAPI's jsonable_encoder walk
+try:
+    import orjson  # noqa: F401
+    GeoResponse = ORJSONResponse
+except ImportError:
+    GeoResponse = JSONResponse
+
 
 class QueryRequest(BaseModel):
     """Standard RAG query request"""
@@ -470,7 +480,7 @@ async def get_geo_heatmap(
             min_articles=min_articles
         )
         
-        return heatmap
+        return GeoResponse(heatmap)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Heatmap generation failed: {str(e)}")
@@ -502,7 +512,7 @@ async def get_scheme_coverage_map(
             days=days
         )
         
-        return coverage_map
+        return GeoResponse(coverage_map)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Coverage map failed: {str(e)}")
@@ -533,7 +543,7 @@ async def get_ministry_footprint(
             days=days
         )
         
-        return footprint
+        return GeoResponse(footprint)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Ministry footprint failed: {str(e)}")
@@ -568,11 +578,11 @@ async def detect_crisis_zones(
             min_articles=min_articles
         )
         
-        return {
+        return GeoResponse({
             "total_crisis_zones": len(crisis_zones),
             "crisis_zones": crisis_zones,
             "generated_at": datetime.now().isoformat()
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Crisis detection failed: {str(e)}")
@@ -600,7 +610,7 @@ async def compare_regions(
             days=days
         )
         
-        return comparison
+        return GeoResponse(comparison)
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Regional comparison failed: {str(e)}")
@@ -17,7 +17,7 @@ from dateutil import parser as dtparser
 from .config import settings
 from .database import Database
 from .nlp_model import NLPModel
-from .language_processor import MultilingualProcessor
+from .language_processor import get_language_processor
 from .utils import compute_article_hash, normalize_sentiment
 from .goi_filter import stage2_keyword_filter, classify_goi_relevance
 from .content_classifier import classify_content, is_international_news
@@ -25,10 +25,10 @@ from .pib_alerts import send_pib_alert
 from .schemes_database import find_schemes_in_text
 from .confidence_scorer import calculate_confidence_score, get_confidence_statistics
 try:
-    from .geo_classifier import classify_article_region
+    from .geo_classifier import classify_articles_region
 except ImportError:
-    def classify_article_region(article_dict):
-        return None
+    def classify_articles_region(article_dicts):
+        return [None] * len(article_dicts)
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +45,7 @@ class AsyncNewsCollector:
     def __init__(self, db: Database, nlp: Optional[NLPModel] = None):
         self.db = db
         self.nlp = nlp or NLPModel()
-        self.lang_processor = MultilingualProcessor()
+        self.lang_processor = get_language_processor()
         self.feeds = self._load_feeds(settings.FEEDS_FILE)
         
         # Performance settings
@@ -125,16 +125,13 @@ class AsyncNewsCollector:
         
         return (False, "")
     
-    def process_article_sync(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def screen_article(self, article_data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """
-        Process single article (synchronous - called in batch).
-        Returns None if article should be rejected.
+        Cheap first pass over a raw feed entry: required fields and the early
+        rejection filter. Returns the fields process_article_sync needs, or
+        None if article should be rejected.
         """
         entry = article_data["entry"]
-        feed_url = article_data["feed_url"]
-        source = article_data["feed_source"]
-        language = article_data["feed_language"]
-        region = article_data["feed_region"]
         
         # Extract basic info
         title = entry.get("title", "").strip()
@@ -150,6 +147,29 @@ class AsyncNewsCollector:
             logger.debug(f"[EARLY REJECT] {title[:50]} - {reject_reason}")
             return None
         
+        return {
+            **article_data,
+            "title": title,
+            "summary": summary,
+            "link": link,
+            "full_text": f"{title}\\n\\n{summary}",
+        }
+    
+    def process_article_sync(self, screened: Dict[str, Any], lang_result: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Process single article (synchronous - called in batch) that passed
+        screen_article, given detect_language() output for its full_text.
+        Returns None if article should be rejected.
+        """
+        entry = screened["entry"]
+        source = screened["feed_source"]
+        language = screened["feed_language"]
+        region = screened["feed_region"]
+        title = screened["title"]
+        summary = screened["summary"]
+        link = screened["link"]
+        full_text = screened["full_text"]
+        
         # Published date
         pub_date_str = entry.get("published") or entry.get("updated")
         published_at = None
@@ -161,25 +181,18 @@ class AsyncNewsCollector:
         else:
             published_at = datetime.utcnow()
         
-        # Language detection
-        full_text = f"{title}\\n\\n{summary}"
-        detected_lang = None
-        detected_script = None
-        lang_confidence = None
+        # Language detection (done by the caller)
+        detected_lang = lang_result.get("code")
+        detected_script = lang_result.get("script")
+        lang_confidence = lang_result.get("confidence")
         
-        if full_text.strip():
-            lang_result = self.lang_processor.detect_language(full_text)
-            detected_lang = lang_result.get("code")
-            detected_script = lang_result.get("script")
-            lang_confidence = lang_result.get("confidence")
-            
-            # Use detected language if confidence is high (>85%) - it's more accurate than feed metadata
-            if lang_confidence and lang_confidence > 0.85:
-                if detected_lang != language:
-                    logger.info(f"[LANG FIX] Feed says '{language}' but detected '{detected_lang}' (confidence: {lang_confidence:.2f}) - using detected")
-                language = detected_lang
-            elif not language:
-                language = detected_lang or language
+        # Use detected language if confidence is high (>85%) - it's more accurate than feed metadata
+        if lang_confidence and lang_confidence > 0.85:
+            if detected_lang != language:
+                logger.info(f"[LANG FIX] Feed says '{language}' but detected '{detected_lang}' (confidence: {lang_confidence:.2f}) - using detected")
+            language = detected_lang
+        elif not language:
+            language = detected_lang or language
         
         # Translation (if needed)
         text_for_nlp = full_text
@@ -187,11 +200,14 @@ class AsyncNewsCollector:
         translated_summary = None
         
         if language and language != "en" and settings.TRANSLATION_ENABLED:
-            translated_text = self.lang_processor.translate_to_english(full_text, language)
-            if translated_text:
-                text_for_nlp = translated_text
-                translated_title = self.lang_processor.translate_to_english(title, language)
-                translated_summary = self.lang_processor.translate_to_english(summary, language)
+            # One batched translation call for title and summary
+            # full_text is title + summary, so the NLP text is rebuilt from whichever
+            # of the two translations succeeded (original text for a failed field)
+            text_en, translated_title, translated_summary = self.lang_processor.translate_article(
+                title, summary, language
+            )
+            if text_en:
+                text_for_nlp = text_en
         
         # Quick GoI keyword pre-filter
         prelim_goi = stage2_keyword_filter(full_text, detected_lang or language)
@@ -241,10 +257,13 @@ class AsyncNewsCollector:
         
         logger.info(f"[ASYNC] Fetched total {len(all_articles)} raw articles")
         
-        # Step 2: Process articles with early rejection (fast)
+        # Step 2: Process articles with early rejection (fast); language detection
+        # for everything that survives it runs as one batched call
+        screened_articles = [s for s in map(self.screen_article, all_articles) if s]
+        lang_results = self.lang_processor.detect_language_many([s["full_text"] for s in screened_articles])
         processed_articles = []
-        for article_data in all_articles:
-            processed = self.process_article_sync(article_data)
+        for screened, lang_result in zip(screened_articles, lang_results):
+            processed = self.process_article_sync(screened, lang_result)
             if processed:
                 processed_articles.append(processed)
         
@@ -283,8 +302,19 @@ class AsyncNewsCollector:
                     article["entities"] = analysis.get("entities", []) or []
         
         # Step 4: Classification and final processing
+        # Geographic classification runs as one batch so NER (when enabled)
+        # does batched forward passes instead of one per article
+        detected_regions = classify_articles_region([
+            {
+                'title': article["title"],
+                'summary': article["summary"],
+                'content': article.get("content", "")
+            }
+            for article in processed_articles
+        ])
+        
         final_articles = []
-        for article in processed_articles:
+        for article, detected_region in zip(processed_articles, detected_regions):
             # GoI relevance
             relevance = classify_goi_relevance(article["full_text"], article.get("entities", []))
             article["is_goi"] = relevance.get("is_goi", False)
@@ -304,11 +334,6 @@ class AsyncNewsCollector:
                     article["relevance_score"] = max(article["relevance_score"], 0.8)
             
             # Geographic classification
-            detected_region = classify_article_region({
-                'title': article["title"],
-                'summary': article["summary"],
-                'content': article.get("content", "")
-            })
             if detected_region:
                 article["region"] = detected_region
             
@@ -368,15 +393,10 @@ class AsyncNewsCollector:
         created = 0
         updated = 0
         
-        for article in final_articles:
-            try:
-                result = self.db.upsert_article(article)
-                if result == "created":
-                    created += 1
-                elif result == "updated":
-                    updated += 1
-            except Exception as e:
-                logger.error(f"Failed to upsert article: {e}")
+        try:
+            created, updated = self.db.upsert_articles_bulk(final_articles)
+        except Exception as e:
+            logger.error(f"Failed to bulk upsert articles: {e}")
         
         logger.info(f"[ASYNC] Collection complete: {created} created, {updated} updated")
         
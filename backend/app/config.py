@@ -24,6 +24,12 @@ class Settings(BaseSettings):
         "postgresql+psycopg2://postgres:postgres@db:5432/newsdb"
     )
 
+    DB_POOL_SIZE: int = 0  # 0 = max(10, 2 x CPU count)
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 5  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    ANALYTICS_CACHE_TTL: int = 60  # Seconds to reuse /analytics aggregate results (0 disables)
+
     # Mongo (optional)
     MONGODB_URI: str = "mongodb://mongo:27017"
     MONGODB_DB: str = "newsdb"
@@ -10,6 +10,7 @@ PIB OFFICER MODE: STRICT FILTERING
 """
 
 from __future__ import annotations
+from collections import Counter
 from typing import Dict, Any, List, Tuple
 import re
 
@@ -113,6 +114,31 @@ def is_international_news(text: str, title: str) -> Tuple[bool, str]:
     return (False, "")
 
 
+# Unicode block for each language's keyword bank. A bank can only match if the
+# article contains at least one character from its script, so checking this
+# once lets classify_content skip banks that are guaranteed to miss.
+_SCRIPT_PATTERNS = {
+    "en": re.compile(r"[a-z]"),
+    "hi": re.compile("[\u0900-\u097F]"),
+    "mr": re.compile("[\u0900-\u097F]"),
+    "bn": re.compile("[\u0980-\u09FF]"),
+    "as": re.compile("[\u0980-\u09FF]"),
+    "pa": re.compile("[\u0A00-\u0A7F]"),
+    "gu": re.compile("[\u0A80-\u0AFF]"),
+    "or": re.compile("[\u0B00-\u0B7F]"),
+    "ta": re.compile("[\u0B80-\u0BFF]"),
+    "te": re.compile("[\u0C00-\u0C7F]"),
+    "kn": re.compile("[\u0C80-\u0CFF]"),
+    "ml": re.compile("[\u0D00-\u0D7F]"),
+}
+
+
+def _has_script(lang: str, text: str) -> bool:
+    """Check whether text contains any character of the given language's script."""
+    pattern = _SCRIPT_PATTERNS.get(lang)
+    return pattern is None or pattern.search(text) is not None
+
+
 # Government-related keywords (schemes, policies, services)
 # NOTE: All Indian states receive the same central government schemes
 # Each language has 150+ keywords covering all major schemes
@@ -414,6 +440,21 @@ BUSINESS_KEYWORDS = {
 }
 
 
+# Priority-boost indicators, compiled once into a single alternation each so the
+# early Government boost is one C-level scan instead of a Python loop of
+# substring checks over a list rebuilt on every call.
+OFFICIAL_SOURCE_INDICATORS = (
+    " pib", "press information bureau", "pib.gov.in", "ministry of",
+    "government of india", "भारत सरकार",
+)
+GOVERNMENT_INDICATORS = (
+    "government scheme", "सरकारी योजना", "yojana", "योजना", "scheme", "pm ",
+    "pradhan mantri", "प्रधानमंत्री", "infrastructure", "industrial park",
+)
+_OFFICIAL_SOURCE_RE = re.compile("|".join(map(re.escape, OFFICIAL_SOURCE_INDICATORS)))
+_GOVERNMENT_INDICATOR_RE = re.compile("|".join(map(re.escape, GOVERNMENT_INDICATORS)))
+
+
 def classify_content(text: str, title: str, detected_lang: str = "en") -> Dict[str, Any]:
     """
     Classify article content into categories.
@@ -464,53 +505,57 @@ def classify_content(text: str, title: str, detected_lang: str = "en") -> Dict[s
         "Business": 0
     }
     
-    matched_keywords = []
+    # Insertion-ordered dict so repeated hits are recorded once, in first-seen order
+    matched_keywords: Dict[str, None] = {}
     
     # PRIORITY BOOST: PIB/Official sources are always Government
-    if any(indicator in combined_text for indicator in [" pib", "press information bureau", "pib.gov.in", "ministry of", "government of india", "भारत सरकार"]):
+    if _OFFICIAL_SOURCE_RE.search(combined_text):
         scores["Government"] += 20  # Strong boost for official sources
-        matched_keywords.append("official_source")
+        matched_keywords["official_source"] = None
     
     # Priority boost for clear government indicators
-    if any(word in combined_text for word in ["government scheme", "सरकारी योजना", "yojana", "योजना", "scheme", "pm ", "pradhan mantri", "प्रधानमंत्री", "infrastructure", "industrial park"]):
+    if _GOVERNMENT_INDICATOR_RE.search(combined_text):
         scores["Government"] += 10
-        matched_keywords.append("government_indicator")
-    
-    # Check Government keywords in native language
-    for keyword in GOVERNMENT_KEYWORDS.get(lang, []):
-        if keyword.lower() in combined_text:
-            scores["Government"] += 2
-            matched_keywords.append(keyword)
-    
-    # Check Political keywords
-    for keyword in POLITICAL_KEYWORDS.get(lang, []):
-        if keyword.lower() in combined_text:
-            scores["Political"] += 2
-            matched_keywords.append(keyword)
-    
-    # Check Entertainment keywords
-    for keyword in ENTERTAINMENT_KEYWORDS.get(lang, []):
-        if keyword.lower() in combined_text:
-            scores["Entertainment"] += 2
-            matched_keywords.append(keyword)
-    
-    # Check Sports keywords
-    for keyword in SPORTS_KEYWORDS.get(lang, []):
-        if keyword.lower() in combined_text:
-            scores["Sports"] += 2
-            matched_keywords.append(keyword)
-    
-    # Check Crime keywords
-    for keyword in CRIME_ACCIDENT_KEYWORDS.get(lang, []):
-        if keyword.lower() in combined_text:
-            scores["Crime"] += 1
-            matched_keywords.append(keyword)
-    
-    # Check Business keywords
-    for keyword in BUSINESS_KEYWORDS.get(lang, []):
-        if keyword.lower() in combined_text:
-            scores["Business"] += 1
-            matched_keywords.append(keyword)
+        matched_keywords["government_indicator"] = None
+    
+    # Skip the keyword banks entirely if the article has no text in their script
+    # (e.g. an English-only article tagged 'hi' can never match Devanagari keywords)
+    if _has_script(lang, combined_text):
+        # Check Government keywords in native language
+        for keyword in GOVERNMENT_KEYWORDS.get(lang, []):
+            if keyword.lower() in combined_text:
+                scores["Government"] += 2
+                matched_keywords[keyword] = None
+    
+        # Check Political keywords
+        for keyword in POLITICAL_KEYWORDS.get(lang, []):
+            if keyword.lower() in combined_text:
+                scores["Political"] += 2
+                matched_keywords[keyword] = None
+    
+        # Check Entertainment keywords
+        for keyword in ENTERTAINMENT_KEYWORDS.get(lang, []):
+            if keyword.lower() in combined_text:
+                scores["Entertainment"] += 2
+                matched_keywords[keyword] = None
+    
+        # Check Sports keywords
+        for keyword in SPORTS_KEYWORDS.get(lang, []):
+            if keyword.lower() in combined_text:
+                scores["Sports"] += 2
+                matched_keywords[keyword] = None
+    
+        # Check Crime keywords
+        for keyword in CRIME_ACCIDENT_KEYWORDS.get(lang, []):
+            if keyword.lower() in combined_text:
+                scores["Crime"] += 1
+                matched_keywords[keyword] = None
+    
+        # Check Business keywords
+        for keyword in BUSINESS_KEYWORDS.get(lang, []):
+            if keyword.lower() in combined_text:
+                scores["Business"] += 1
+                matched_keywords[keyword] = None
     
     # Determine primary category
     max_score = max(scores.values())
@@ -533,7 +578,7 @@ def classify_content(text: str, title: str, detected_lang: str = "en") -> Dict[s
         "primary_category": primary_category,
         "sub_category": sub_category,
         "confidence": confidence,
-        "matched_keywords": matched_keywords[:10],  # Limit to 10
+        "matched_keywords": list(matched_keywords)[:10],  # Limit to 10
         "should_show": should_show,
         "filter_reason": filter_reason
     }
@@ -666,9 +711,16 @@ def _should_show_to_pib(category: str, sub_category: str, text: str, lang: str)
     return (False, f"Uncategorized: {sub_category}")
 
 
+_EMPTY_CLASSIFICATION: Dict[str, Any] = {}
+
+
 def get_filter_statistics(articles: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Calculate filter statistics for a list of articles.
+
+    Intended for ad-hoc in-memory lists (e.g. a batch before it is stored);
+    for persisted articles use Database.filter_statistics(), which does the
+    same aggregation in SQL.
     
     Returns:
         {
@@ -688,27 +740,28 @@ def get_filter_statistics(articles: List[Dict[str, Any]]) -> Dict[str, Any]:
             }
         }
     """
-    stats = {
-        "total": len(articles),
-        "shown": 0,
-        "filtered": 0,
-        "by_category": {},
-        "filtered_breakdown": {}
-    }
+    # Collect category labels in one pass and let Counter tally them in C.
+    # A pandas value_counts() path was considered for big batches, but the
+    # remaining cost is pulling the labels out of the dicts, which a
+    # DataFrame build pays as well, so it would not win anything here.
+    categories: List[str] = []
+    filtered_categories: List[str] = []
     
     for article in articles:
-        classification = article.get("classification", {})
+        classification = article.get("classification") or _EMPTY_CLASSIFICATION
         category = classification.get("primary_category", "Other")
-        should_show = classification.get("should_show", True)
-        
-        # Count by category
-        stats["by_category"][category] = stats["by_category"].get(category, 0) + 1
-        
-        # Count shown vs filtered
-        if should_show:
-            stats["shown"] += 1
-        else:
-            stats["filtered"] += 1
-            stats["filtered_breakdown"][category] = stats["filtered_breakdown"].get(category, 0) + 1
+        categories.append(category)
+        if not classification.get("should_show", True):
+            filtered_categories.append(category)
     
-    return stats
+    by_category = Counter(categories)
+    filtered_breakdown = Counter(filtered_categories)
+    shown = len(articles) - len(filtered_categories)
+    
+    return {
+        "total": len(articles),
+        "shown": shown,
+        "filtered": len(articles) - shown,
+        "by_category": dict(by_category),
+        "filtered_breakdown": dict(filtered_breakdown)
+    }
@@ -1,7 +1,11 @@
 from __future__ import annotations
 import json
+import logging
+import os
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from functools import wraps
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 import uuid
 
 from sqlalchemy import (
@@ -18,15 +22,40 @@ from sqlalchemy import (
     Boolean,
     ForeignKey,
     Integer,
+    literal_column,
+    and_,
+    Computed,
+    select,
+    lambda_stmt,
+    text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import declarative_base, sessionmaker, Session, relationship
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, insert as pg_insert
+from sqlalchemy.orm import declarative_base, sessionmaker, Session, relationship, deferred, defer
+from sqlalchemy.orm.attributes import set_committed_value
 
 from .config import settings
 
+logger = logging.getLogger(__name__)
+
+# orjson is optional; without it SQLAlchemy keeps the stdlib json codec
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 Base = declarative_base()
 
+# Languages that get the relaxed /news filter (Government OR should_show_pib OR is_goi)
+REGIONAL_LANGUAGES = frozenset({"kn", "ta", "te", "bn", "ml", "mr", "gu", "pa", "or", "ur", "as"})
+
+# Confidence scoring fields produced by the collectors that are not stored on Article
+CONFIDENCE_FIELDS = frozenset({
+    "confidence_score", "confidence_level", "contributing_factors",
+    "auto_approved", "auto_rejected", "needs_verification", "anomalies",
+})
+
 
 class Article(Base):
     __tablename__ = "articles"
@@ -78,6 +107,18 @@ class Article(Base):
     should_show_pib = Column(Boolean, default=False)  # Should show to PIB officers (default False)
     filter_reason = Column(String(255), nullable=True)  # Why filtered
 
+    # Full-text search vector maintained by Postgres (title > summary > content).
+    # Deferred so it is only used in WHERE clauses, never loaded with the row.
+    search_tsv = deferred(Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(summary, '')), 'B') || "
+            "setweight(to_tsvector('simple', coalesce(content, '')), 'C')",
+            persisted=True,
+        ),
+    ))
+
 
 Index("idx_articles_published_at", Article.published_at)
 Index("idx_articles_sentiment", Article.sentiment_label)
@@ -89,6 +130,46 @@ Index("idx_articles_is_goi", Article.is_goi)
 Index("idx_articles_source_type", Article.source_type)
 Index("idx_articles_content_category", Article.content_category)
 Index("idx_articles_should_show_pib", Article.should_show_pib)
+# Composite indexes matching the list_articles filter + sort (migration 15)
+Index(
+    "idx_articles_pib_gov_pub",
+    Article.published_at.desc().nullslast(),
+    Article.collected_at.desc(),
+    postgresql_where=and_(Article.should_show_pib == True, Article.content_category == 'Government'),
+)
+Index("idx_articles_language_pub", Article.language, Article.published_at.desc().nullslast())
+Index("idx_articles_detected_language_pub", Article.detected_language, Article.published_at.desc().nullslast())
+Index("idx_articles_search_tsv", Article.search_tsv, postgresql_using="gin")
+Index(
+    "idx_articles_topic_labels_pib_gov",
+    Article.topic_labels,
+    postgresql_using="gin",
+    postgresql_where=and_(Article.should_show_pib == True, Article.content_category == 'Government'),
+)
+
+# list_articles ships only this much of content (the card preview) and skips
+# the JSONB columns entirely
+LIST_CONTENT_PREVIEW_CHARS = 300
+_LIST_DEFERRED_COLUMNS = (
+    defer(Article.content),
+    defer(Article.entities),
+    defer(Article.goi_entities),
+)
+
+# Columns needed to render an article in a list view (see Database.list_articles_summary)
+ARTICLE_SUMMARY_COLUMNS = (
+    Article.id,
+    Article.url,
+    Article.title,
+    Article.summary,
+    Article.source,
+    Article.region,
+    Article.language,
+    Article.published_at,
+    Article.sentiment_label,
+    Article.sentiment_score,
+    Article.content_category,
+)
 
 
 class User(Base):
@@ -221,80 +302,354 @@ Index("idx_pib_alerts_is_reviewed", PIBAlert.is_reviewed)
 Index("idx_pib_alerts_created", PIBAlert.created_at)
 
 
+# Static SQL, built once so SQLAlchemy's compiled cache serves every call
+_ANALYTICS_CATEGORY_SQL = text(
+    """
+    SELECT label, COUNT(*) FROM (
+        SELECT unnest(topic_labels) AS label FROM articles
+        WHERE topic_labels IS NOT NULL
+        AND should_show_pib = TRUE
+        AND content_category = 'Government'
+    ) t
+    GROUP BY label
+    ORDER BY COUNT(*) DESC
+    LIMIT 50
+    """
+)
+
+
+_engines: Dict[str, Any] = {}
+
+
+def _json_codec_kwargs() -> Dict[str, Any]:
+    """Engine kwargs that route JSON/JSONB (de)serialization through orjson."""
+    if not ORJSON_AVAILABLE:
+        return {}
+    # OPT_SERIALIZE_NUMPY keeps numpy scalars (NER confidences) writable, as
+    # the stdlib encoder accepted np.float64
+    return {
+        "json_serializer": lambda obj: orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode(),
+        "json_deserializer": orjson.loads,
+    }
+
+
+def _get_engine(database_url: str):
+    """
+    Return the process-wide engine (and connection pool) for a database URL.
+
+    The API builds a Database per request, so creating the engine in
+    __init__ meant a fresh, cold pool every time. Engines are shared
+    instead, with a LIFO pool so a small hot set of connections (and the
+    plans Postgres has cached on them) stays in use under bursty load.
+    """
+    engine = _engines.get(database_url)
+    if engine is None:
+        engine = create_engine(
+            database_url,
+            future=True,
+            pool_pre_ping=True,
+            pool_size=settings.DB_POOL_SIZE or max(10, (os.cpu_count() or 1) * 2),
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,  # fail fast instead of queueing forever
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_use_lifo=True,
+            connect_args={"options": "-c statement_timeout=30000"},  # 30 second timeout
+            **_json_codec_kwargs(),
+        )
+        _engines[database_url] = engine
+    return engine
+
+
+# Database URLs whose schema create_all() has already checked in this process
+_schema_ready: set = set()
+
+# Columns added after the first articles release; create_all() adds any that
+# are missing on older databases (name -> DDL type)
+_LEGACY_ARTICLE_COLUMNS = {
+    "is_goi": "BOOLEAN",
+    "relevance_score": "DOUBLE PRECISION",
+    "goi_ministries": "TEXT[]",
+    "goi_schemes": "TEXT[]",
+    "goi_entities": "JSONB",
+    "goi_matched_terms": "TEXT[]",
+    "content_category": "VARCHAR(64)",
+    "content_sub_category": "VARCHAR(128)",
+    "classification_confidence": "DOUBLE PRECISION",
+    "classification_keywords": "TEXT[]",
+    "should_show_pib": "BOOLEAN DEFAULT TRUE",
+    "filter_reason": "VARCHAR(255)",
+}
+
+_ARTICLE_COLUMNS_SQL = text(
+    "SELECT column_name FROM information_schema.columns "
+    "WHERE table_schema = current_schema() AND table_name = 'articles'"
+)
+
+
+# Daily geo rollup read by GeoIntelligence.get_heat_map_data (migration 20)
+_REFRESH_GEO_ROLLUP_SQL = text("REFRESH MATERIALIZED VIEW CONCURRENTLY geo_daily_agg")
+
+
+def _ttl_cached(method):
+    """
+    Reuse an analytics aggregate for settings.ANALYTICS_CACHE_TTL seconds.
+
+    Results are keyed by database URL rather than by instance, because the
+    API builds a new Database per request. The counts only move as new
+    articles trickle in, so a short TTL turns repeated dashboard hits into
+    dict lookups instead of full GROUP BY scans.
+    """
+    cache: Dict[str, Tuple[float, Any]] = {}
+
+    @wraps(method)
+    def wrapper(self):
+        ttl = settings.ANALYTICS_CACHE_TTL
+        if ttl <= 0:
+            return method(self)
+        key = str(self.engine.url)
+        now = time.monotonic()
+        hit = cache.get(key)
+        if hit is not None and now - hit[0] < ttl:
+            return hit[1]
+        result = method(self)
+        cache[key] = (now, result)
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
 class Database:
     """PostgreSQL database interface."""
     
     def __init__(self, database_url: Optional[str] = None):
         if settings.DB_PROVIDER.lower() == "mongodb":
             raise ValueError("Use MongoDBRepository for MongoDB. This class is for PostgreSQL only.")
-        # Add connection pool settings and statement timeout
-        self.engine = create_engine(
-            database_url or settings.DATABASE_URL,
-            future=True,
-            pool_pre_ping=True,
-            pool_size=5,
-            max_overflow=10,
-            connect_args={"options": "-c statement_timeout=30000"}  # 30 second timeout
-        )
+        self.engine = _get_engine(database_url or settings.DATABASE_URL)
         self.SessionLocal = sessionmaker(bind=self.engine, expire_on_commit=False)
 
     def create_all(self):
+        """
+        Create missing tables/indexes and patch legacy articles columns.
+
+        Runs at most once per database URL per process: the API startup hook
+        and every /collect run call this, and the DDL only has work to do on
+        databases that predate the GoI/classification columns.
+        """
+        key = str(self.engine.url)
+        if key in _schema_ready:
+            return
         Base.metadata.create_all(self.engine)
-        # Attempt to ensure GoI and classification columns exist (idempotent for Postgres)
+        # Only take the ALTER TABLE lock when a column is actually missing
         try:
-            with self.engine.connect() as conn:
-                conn.exec_driver_sql(
-                    """
-                    ALTER TABLE articles
-                    ADD COLUMN IF NOT EXISTS is_goi BOOLEAN,
-                    ADD COLUMN IF NOT EXISTS relevance_score DOUBLE PRECISION,
-                    ADD COLUMN IF NOT EXISTS goi_ministries TEXT[],
-                    ADD COLUMN IF NOT EXISTS goi_schemes TEXT[],
-                    ADD COLUMN IF NOT EXISTS goi_entities JSONB,
-                    ADD COLUMN IF NOT EXISTS goi_matched_terms TEXT[],
-                    ADD COLUMN IF NOT EXISTS content_category VARCHAR(64),
-                    ADD COLUMN IF NOT EXISTS content_sub_category VARCHAR(128),
-                    ADD COLUMN IF NOT EXISTS classification_confidence DOUBLE PRECISION,
-                    ADD COLUMN IF NOT EXISTS classification_keywords TEXT[],
-                    ADD COLUMN IF NOT EXISTS should_show_pib BOOLEAN DEFAULT TRUE,
-                    ADD COLUMN IF NOT EXISTS filter_reason VARCHAR(255);
-                    """
-                )
-                conn.commit()
-        except Exception:
-            pass
+            with self.engine.begin() as conn:
+                existing = set(conn.execute(_ARTICLE_COLUMNS_SQL).scalars())
+                missing = [col for col in _LEGACY_ARTICLE_COLUMNS if col not in existing]
+                if missing:
+                    conn.exec_driver_sql("SET LOCAL lock_timeout = '5s'")
+                    conn.exec_driver_sql(
+                        "ALTER TABLE articles "
+                        + ", ".join(
+                            f"ADD COLUMN IF NOT EXISTS {col} {_LEGACY_ARTICLE_COLUMNS[col]}"
+                            for col in missing
+                        )
+                    )
+        except Exception as e:
+            logger.warning(f"Could not patch articles columns: {e}")
+            return
+        _schema_ready.add(key)
 
     def get_session(self) -> Session:
         return self.SessionLocal()
 
+    def refresh_geo_rollup(self):
+        """Refresh the geo_daily_agg materialized view behind the geo heat map."""
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(_REFRESH_GEO_ROLLUP_SQL)
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"Could not refresh geo_daily_agg: {e}")
+
     # Basic CRUD helpers
-    def upsert_article(self, data: Dict[str, Any]) -> Tuple[Article, bool]:
-        """Insert or update article by URL/hash. Returns (article, created)."""
-        # Remove confidence scoring fields that are not in the database schema
-        confidence_fields = [
-            "confidence_score", "confidence_level", "contributing_factors",
-            "auto_approved", "auto_rejected", "needs_verification", "anomalies"
-        ]
-        data = {k: v for k, v in data.items() if k not in confidence_fields}
+    @staticmethod
+    def _strip_confidence_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Remove confidence scoring fields that are not in the database schema."""
+        return {k: v for k, v in data.items() if k not in CONFIDENCE_FIELDS}
+
+    @staticmethod
+    def _on_hash_conflict_update(stmt, keys):
+        """Turn an INSERT into INSERT ... ON CONFLICT (hash) DO UPDATE of the given keys."""
+        return stmt.on_conflict_do_update(
+            index_elements=[Article.hash],
+            set_={k: stmt.excluded[k] for k in keys if k not in ("id", "hash")},
+        )
+
+    def upsert_article(self, data: Dict[str, Any]) -> Tuple[str, bool]:
+        """Insert or update article by hash. Returns (article id, created)."""
+        data = self._strip_confidence_fields(data)
+        
+        # Single INSERT ... ON CONFLICT (hash) DO UPDATE; xmax is 0 only for
+        # freshly inserted rows, which tells us whether this was a create.
+        stmt = self._on_hash_conflict_update(pg_insert(Article).values(**data), data)
+        # Only the id comes back; callers never need the rest of the row
+        stmt = stmt.returning(Article.id, literal_column("xmax = 0").label("created"))
         
         with self.get_session() as session:
-            existing = (
-                session.query(Article)
-                .filter((Article.url == data["url"]) | (Article.hash == data["hash"]))
-                .first()
-            )
-            if existing:
-                for k, v in data.items():
-                    setattr(existing, k, v)
-                session.add(existing)
-                session.commit()
-                session.refresh(existing)
-                return existing, False
-            art = Article(**data)
-            session.add(art)
+            article_id, created = session.execute(stmt).one()
             session.commit()
-            session.refresh(art)
-            return art, True
+            return article_id, bool(created)
+
+    def upsert_articles_bulk(self, rows: List[Dict[str, Any]], chunk_size: int = 500) -> Tuple[int, int]:
+        """
+        Insert or update many articles by hash with one multi-row
+        INSERT ... ON CONFLICT per chunk. A chunk that fails is retried
+        row by row. Returns (created, updated) over the rows that were saved.
+        """
+        # ON CONFLICT cannot touch the same row twice in one statement,
+        # so collapse duplicate hashes first (last one wins)
+        by_hash: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            row = self._strip_confidence_fields(row)
+            by_hash[row["hash"]] = row
+        if not by_hash:
+            return 0, 0
+
+        # Multi-row VALUES needs the same keys on every row. Padding a missing
+        # key with None would overwrite the stored value (e.g. sentiment when
+        # NLP returned none this time), so each key set gets its own INSERT.
+        shapes: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in by_hash.values():
+            shapes.setdefault(tuple(sorted(row)), []).append(row)
+
+        created = 0
+        updated = 0
+        with self.get_session() as session:
+            for keys, shape_rows in shapes.items():
+                for start in range(0, len(shape_rows), chunk_size):
+                    chunk = shape_rows[start:start + chunk_size]
+                    stmt = self._on_hash_conflict_update(pg_insert(Article).values(chunk), keys)
+                    stmt = stmt.returning(literal_column("xmax = 0"))
+                    try:
+                        chunk_created = sum(1 for (is_new,) in session.execute(stmt) if is_new)
+                        session.commit()
+                    except Exception as e:
+                        # One bad row fails the whole statement; retry this
+                        # chunk row by row so only that row is lost
+                        session.rollback()
+                        logger.warning(f"Bulk upsert of {len(chunk)} articles failed, retrying one by one: {e}")
+                        for row in chunk:
+                            try:
+                                _, is_created = self.upsert_article(row)
+                            except Exception as row_error:
+                                logger.error(f"Failed to upsert article {row.get('url')}: {row_error}")
+                                continue
+                            if is_created:
+                                created += 1
+                            else:
+                                updated += 1
+                        continue
+                    created += chunk_created
+                    updated += len(chunk) - chunk_created
+        return created, updated
+
+    def existing_hashes(self, hashes: Iterable[str]) -> Set[str]:
+        """Subset of the given article hashes that are already stored (one lookup on the unique hash index)."""
+        hashes = list(set(hashes))
+        if not hashes:
+            return set()
+        with self.get_session() as session:
+            return set(session.execute(select(Article.hash).where(Article.hash.in_(hashes))).scalars())
+
+    @staticmethod
+    def _filter_articles(
+        stmt: StatementLambdaElement,
+        sentiment: Optional[str] = None,
+        region: Optional[str] = None,
+        category: Optional[str] = None,
+        source: Optional[str] = None,
+        language: Optional[str] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        q: Optional[str] = None,
+        goi_only: bool = False,
+    ) -> StatementLambdaElement:
+        """
+        Compose the /news listing filters onto a lambda_stmt.
+
+        Each filter is its own lambda fragment, so SQLAlchemy caches the
+        compiled SQL per combination of active filters and only re-binds
+        parameter values on later calls. Values must be computed outside
+        the lambdas; the lambdas themselves may only build SQL.
+        """
+        # Apply different filtering based on language
+        # For English/Hindi: Strict filtering (Government category + should_show_pib)
+        # For Regional languages: Relaxed filtering (Government category OR should_show_pib OR is_goi)
+        if language in REGIONAL_LANGUAGES:
+            # Relaxed filtering for regional languages - show if ANY condition is true
+            stmt += lambda s: s.where(
+                (Article.content_category == 'Government') |
+                (Article.should_show_pib == True) |
+                (Article.is_goi == True)
+            )
+        else:
+            # Strict filtering for English/Hindi, and the default when no
+            # language (or "All Languages") is given
+            stmt += lambda s: s.where(
+                Article.should_show_pib == True,
+                Article.content_category == 'Government'
+            )
+        
+        if goi_only:
+            stmt += lambda s: s.where(Article.is_goi.is_(True))
+        
+        # Normalize sentiment filter (lowercase)
+        if sentiment:
+            sentiment_normalized = sentiment.lower().strip()
+            stmt += lambda s: s.where(func.lower(Article.sentiment_label) == sentiment_normalized)
+        
+        # Region filter - case-insensitive partial match
+        if region:
+            region_pattern = f"%{region}%"
+            stmt += lambda s: s.where(Article.region.ilike(region_pattern))
+        
+        if source:
+            stmt += lambda s: s.where(Article.source == source)
+        
+        # Language filter - check both language and detected_language fields
+        if language:
+            stmt += lambda s: s.where(
+                (Article.language == language) | 
+                (Article.detected_language == language)
+            )
+        
+        # Category filter - search in topic_labels array
+        if category:
+            # Built outside the lambda: a raw closure value inside ANY() would
+            # be bound with the array type instead of the element type
+            has_category = Article.topic_labels.any(category)
+            stmt += lambda s: s.where(has_category)
+        
+        # Search filter - full-text match on title, summary, content (GIN-indexed)
+        if q:
+            stmt += lambda s: s.where(
+                Article.search_tsv.op("@@")(func.plainto_tsquery("simple", q))
+            )
+        
+        if date_from:
+            stmt += lambda s: s.where(Article.published_at >= date_from)
+        if date_to:
+            stmt += lambda s: s.where(Article.published_at <= date_to)
+        
+        return stmt
+
+    @staticmethod
+    def _page_articles(stmt: StatementLambdaElement, limit: int, offset: int) -> StatementLambdaElement:
+        """Newest-first ordering plus LIMIT/OFFSET for a /news listing."""
+        stmt += lambda s: s.order_by(
+            Article.published_at.desc().nullslast(), Article.collected_at.desc()
+        ).offset(offset).limit(limit)
+        return stmt
 
     def list_articles(
         self,
@@ -310,114 +665,132 @@ class Database:
         q: Optional[str] = None,
         goi_only: bool = False,
     ) -> Tuple[List[Article], int]:
-        import logging
-        logger = logging.getLogger(__name__)
+        """
+        Page of articles for the /news listing plus the total match count.
+
+        Returned articles are list views: content is cut to
+        LIST_CONTENT_PREVIEW_CHARS and entities / goi_entities are not
+        loaded. Use get_article_detail() for the full row.
+        """
+        filters = dict(
+            sentiment=sentiment,
+            region=region,
+            category=category,
+            source=source,
+            language=language,
+            date_from=date_from,
+            date_to=date_to,
+            q=q,
+            goi_only=goi_only,
+        )
+        # The total rides along as a window count so rows and count come
+        # from a single scan. The heavy columns are deferred and only a
+        # prefix of content is shipped for the card preview.
+        stmt = lambda_stmt(
+            lambda: select(
+                Article,
+                func.left(Article.content, LIST_CONTENT_PREVIEW_CHARS),
+                func.count().over().label("total"),
+            ).options(*_LIST_DEFERRED_COLUMNS)
+        )
+        stmt = self._page_articles(self._filter_articles(stmt, **filters), limit, offset)
         
         with self.get_session() as session:
-            query = session.query(Article)
-            
-            # Log incoming filters
-            logger.info(f"[FILTER] Incoming params: sentiment={sentiment}, region={region}, category={category}, source={source}, language={language}, goi_only={goi_only}")
-            
-            # Apply different filtering based on language
-            # For English/Hindi: Strict filtering (Government category + should_show_pib)
-            # For Regional languages: Relaxed filtering (Government category OR should_show_pib OR is_goi)
-            if language in ['en', 'hi']:
-                # Strict filtering for English/Hindi
-                query = query.filter(
-                    Article.should_show_pib == True,
-                    Article.content_category == 'Government'
-                )
-                logger.info(f"[FILTER] Applied STRICT filter for {language}")
-            elif language in ['kn', 'ta', 'te', 'bn', 'ml', 'mr', 'gu', 'pa', 'or', 'ur', 'as']:
-                # Relaxed filtering for regional languages - show if ANY condition is true
-                query = query.filter(
-                    (Article.content_category == 'Government') |
-                    (Article.should_show_pib == True) |
-                    (Article.is_goi == True)
-                )
-                logger.info(f"[FILTER] Applied RELAXED filter for regional language {language}")
-            else:
-                # No specific language filter or "All Languages" - show Government category articles
-                query = query.filter(
-                    Article.should_show_pib == True,
-                    Article.content_category == 'Government'
-                )
-                logger.info(f"[FILTER] Applied DEFAULT filter (no language or mixed)")
-            
-            if goi_only:
-                query = query.filter(Article.is_goi.is_(True))
-            
-            # Normalize sentiment filter (lowercase)
-            if sentiment:
-                sentiment_normalized = sentiment.lower().strip()
-                query = query.filter(func.lower(Article.sentiment_label) == sentiment_normalized)
-                logger.info(f"[FILTER] Applied sentiment filter: {sentiment_normalized}")
-            
-            # Region filter - case-insensitive partial match
-            if region:
-                query = query.filter(Article.region.ilike(f"%{region}%"))
-                logger.info(f"[FILTER] Applied region filter: {region}")
-            
-            if source:
-                query = query.filter(Article.source == source)
-                logger.info(f"[FILTER] Applied source filter: {source}")
-            
-            # Language filter - check both language and detected_language fields
-            if language:
-                query = query.filter(
-                    (Article.language == language) | 
-                    (Article.detected_language == language)
-                )
-                logger.info(f"[FILTER] Applied language filter: {language}")
-            
-            # Category filter - search in topic_labels array
-            if category:
-                query = query.filter(Article.topic_labels.any(category))
-                logger.info(f"[FILTER] Applied category filter: {category}")
-            
-            # Search filter - case-insensitive search in title, summary, content
-            if q:
-                search_term = f"%{q}%"
-                query = query.filter(
-                    (Article.title.ilike(search_term)) |
-                    (Article.summary.ilike(search_term)) |
-                    (Article.content.ilike(search_term))
-                )
-                logger.info(f"[FILTER] Applied search filter: {q}")
-            
-            if date_from:
-                query = query.filter(Article.published_at >= date_from)
-            if date_to:
-                query = query.filter(Article.published_at <= date_to)
-            
-            # Count total matching documents
-            try:
-                total = query.count()
-                logger.info(f"[FILTER] Total matching documents: {total}")
-            except Exception as e:
-                logger.error(f"[FILTER] Error counting documents: {e}")
-                total = 0
-            
-            # Get rows - sort by published_at desc
+            total = 0
             try:
-                rows = (
-                    query.order_by(Article.published_at.desc().nullslast(), Article.collected_at.desc())
-                    .offset(offset)
-                    .limit(limit)
-                    .all()
-                )
-                logger.info(f"[FILTER] Returned {len(rows)} documents")
+                results = session.execute(stmt).all()
+                rows = []
+                for article, content_preview, _ in results:
+                    # Mark the deferred attributes as loaded so the detached
+                    # objects can be serialized without a lazy load
+                    set_committed_value(article, "content", content_preview)
+                    set_committed_value(article, "entities", None)
+                    set_committed_value(article, "goi_entities", None)
+                    rows.append(article)
+                if results:
+                    total = int(results[0][-1])
+                elif offset:
+                    # Paged past the end: no row to carry the window count
+                    count_stmt = lambda_stmt(lambda: select(func.count()).select_from(Article))
+                    total = session.execute(self._filter_articles(count_stmt, **filters)).scalar() or 0
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[FILTER] %s returned %d of %d documents (limit=%d offset=%d)",
+                        {k: v for k, v in filters.items() if v}, len(rows), total, limit, offset,
+                    )
             except Exception as e:
                 logger.error(f"[FILTER] Query error: {e}")
                 rows = []
             
             return rows, total
 
+    def get_article_detail(self, article_id: str) -> Optional[Article]:
+        """Load a single article with all columns, including content and entities."""
+        with self.get_session() as session:
+            return session.get(Article, article_id)
+
+    def list_articles_summary(self, limit: int = 50, offset: int = 0, **filters: Any) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Lightweight variant of list_articles for list/feed views.
+
+        Selects only ARTICLE_SUMMARY_COLUMNS (no content, entities or other
+        JSONB/array columns) as plain rows instead of hydrating full Article
+        objects. Accepts the same filters.
+        """
+        stmt = lambda_stmt(
+            lambda: select(*ARTICLE_SUMMARY_COLUMNS, func.count().over().label("total"))
+        )
+        stmt = self._page_articles(self._filter_articles(stmt, **filters), limit, offset)
+        
+        rows: List[Dict[str, Any]] = []
+        total = 0
+        with self.get_session() as session:
+            for row in session.execute(stmt):
+                item = row._asdict()
+                total = int(item.pop("total"))
+                rows.append(item)
+        return rows, total
+
+    def filter_statistics(self) -> Dict[str, Any]:
+        """
+        Content-classification counts aggregated by Postgres in one GROUP BY.
+
+        Returns the same shape as content_classifier.get_filter_statistics,
+        built from at most one row per (category, should_show_pib) pair.
+        Articles without a category count towards the totals only.
+        """
+        with self.get_session() as session:
+            rows = (
+                session.query(Article.content_category, Article.should_show_pib, func.count())
+                .group_by(Article.content_category, Article.should_show_pib)
+                .all()
+            )
+        stats: Dict[str, Any] = {
+            "total": 0,
+            "shown": 0,
+            "filtered": 0,
+            "by_category": {},
+            "filtered_breakdown": {},
+        }
+        for category, should_show, count in rows:
+            count = int(count)
+            stats["total"] += count
+            if should_show is True:
+                stats["shown"] += count
+            elif should_show is False:
+                stats["filtered"] += count
+            if category is None:
+                continue
+            stats["by_category"][category] = stats["by_category"].get(category, 0) + count
+            if should_show is False:
+                stats["filtered_breakdown"][category] = stats["filtered_breakdown"].get(category, 0) + count
+        return stats
+
+    @_ttl_cached
     def analytics_sentiment(self) -> List[Dict[str, Any]]:
         with self.get_session() as session:
             rows = (
-                session.query(Article.sentiment_label, func.count(Article.id))
+                session.query(Article.sentiment_label, func.count())
                 .filter(
                     Article.should_show_pib == True,
                     Article.content_category == 'Government'
@@ -429,52 +802,41 @@ class Database:
                 {"sentiment": s or "unknown", "count": int(c)} for s, c in rows
             ]
 
+    @_ttl_cached
     def analytics_category(self) -> List[Dict[str, Any]]:
         # Flatten topic labels and count
         with self.get_session() as session:
-            # Use raw SQL to unnest topic_labels array
-            conn = session.connection().connection
-            with conn.cursor() as cur:
-                cur.execute(
-                    """
-                    SELECT label, COUNT(*) FROM (
-                        SELECT unnest(topic_labels) AS label FROM articles 
-                        WHERE topic_labels IS NOT NULL 
-                        AND should_show_pib = TRUE
-                        AND content_category = 'Government'
-                    ) t
-                    GROUP BY label
-                    ORDER BY COUNT(*) DESC
-                    LIMIT 50
-                    """
-                )
-                rows = cur.fetchall()
+            rows = session.execute(_ANALYTICS_CATEGORY_SQL).all()
             return [{"category": r[0], "count": int(r[1])} for r in rows]
 
+    @_ttl_cached
     def analytics_region(self) -> List[Dict[str, Any]]:
         with self.get_session() as session:
+            cnt = func.count().label("cnt")
             rows = (
-                session.query(Article.region, func.count(Article.id))
+                session.query(Article.region, cnt)
                 .filter(
                     Article.should_show_pib == True,
                     Article.content_category == 'Government'
                 )
                 .group_by(Article.region)
-                .order_by(func.count(Article.id).desc())
+                .order_by(cnt.desc())
                 .all()
             )
             return [{"region": r or "unknown", "count": int(c)} for r, c in rows]
 
+    @_ttl_cached
     def analytics_sources(self) -> List[Dict[str, Any]]:
         with self.get_session() as session:
+            cnt = func.count().label("cnt")
             rows = (
-                session.query(Article.source, func.count(Article.id))
+                session.query(Article.source, cnt)
                 .filter(
                     Article.should_show_pib == True,
                     Article.content_category == 'Government'
                 )
                 .group_by(Article.source)
-                .order_by(func.count(Article.id).desc())
+                .order_by(cnt.desc())
                 .all()
             )
             return [{"source": s or "unknown", "count": int(c)} for s, c in rows]
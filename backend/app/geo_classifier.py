@@ -3,11 +3,32 @@ NLP-based Geographic Classification Module
 Detects location entities and maps them to Indian states
 """
 import logging
+import os
+import re
+from collections import OrderedDict
 from typing import Optional, Dict, List, Tuple
 from transformers import pipeline, AutoTokenizer, AutoModelForTokenClassification
 
+from .config import settings
+
 logger = logging.getLogger(__name__)
 
+# optimum[onnxruntime] is optional; it enables the int8 ONNX NER model on CPU
+try:
+    from optimum.onnxruntime import ORTModelForTokenClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+# pyahocorasick is optional; without it keyword matching falls back to a
+# per-keyword scan
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 # City to State mapping for major Indian cities
 CITY_STATE_MAP = {
     # Karnataka
@@ -138,85 +159,242 @@ STATE_VARIATIONS = {
 }
 
 
+# Every city/state surface form -> state, for single-lookup mapping
+_SURFACE_TO_STATE = {**STATE_VARIATIONS, **CITY_STATE_MAP}
+
+# Every city/state surface form, longest first so "new delhi" wins over "delhi"
+_LOCATION_KEYWORDS = sorted(_SURFACE_TO_STATE, key=len, reverse=True)
+
+# Single-pass fallback when pyahocorasick is not installed
+_KEYWORD_RE = re.compile(r'\b(' + '|'.join(re.escape(k) for k in _LOCATION_KEYWORDS) + r')\b')
+
+# Aho-Corasick automaton over the same keywords, built once
+_keyword_automaton = None
+
+def _get_keyword_automaton():
+    """Build (once) the automaton used by extract_locations_keyword"""
+    global _keyword_automaton
+    if _keyword_automaton is None:
+        automaton = ahocorasick.Automaton()
+        for keyword in _LOCATION_KEYWORDS:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        _keyword_automaton = automaton
+    return _keyword_automaton
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == '_'
+
+
+NER_MODEL_NAME = "Davlan/xlm-roberta-base-ner-hrl"
+
+# Texts per NER forward pass when classifying in batches
+NER_BATCH_SIZE = 32
+
+# Distinct texts whose NER output is kept in memory
+NER_CACHE_SIZE = 4096
+
+
+def _locations_from_entities(entities: List[Dict]) -> List[Tuple[str, int]]:
+    """Pick (location, position) pairs out of NER pipeline output"""
+    return [
+        (entity['word'].strip().lower(), entity['start'])
+        for entity in entities
+        if entity['entity_group'] in ('LOC', 'GPE', 'LOCATION')
+    ]
+
+
+# Keyword hits longer than this are specific enough to skip NER
+MIN_CONFIDENT_KEYWORD_LEN = 4
+
+
+def _has_confident_keyword(keyword_locations: List[Tuple[str, int]]) -> bool:
+    return any(len(keyword) > MIN_CONFIDENT_KEYWORD_LEN for keyword, _ in keyword_locations)
+
+
 class GeoClassifier:
     def __init__(self, use_ner: bool = True):
         self.use_ner = use_ner
-        self.ner_pipeline = None
-        
-        if use_ner:
+        self._ner_pipeline = None
+        # LRU of NER results keyed by the (truncated) text; re-crawled feeds
+        # send the same headlines over and over
+        self._ner_cache: "OrderedDict[str, Tuple[Tuple[str, int], ...]]" = OrderedDict()
+    
+    @property
+    def ner_pipeline(self):
+        """
+        NER pipeline, loaded on first use so processes that only ever hit
+        the keyword path never pay for the model. Load it before forking
+        workers (e.g. touch this in a prefork parent) to share the weights
+        copy-on-write instead of loading one copy per worker.
+        """
+        if self._ner_pipeline is None and self.use_ner:
             try:
-                model_name = "Davlan/xlm-roberta-base-ner-hrl"
-                self.ner_pipeline = pipeline("ner", model=model_name, aggregation_strategy="simple")
-                logger.info(f"[GEO] NER model loaded: {model_name}")
+                self._ner_pipeline = self._load_ner_pipeline(NER_MODEL_NAME)
             except Exception as e:
                 logger.warning(f"[GEO] NER model failed to load: {e}. Using keyword matching only.")
                 self.use_ner = False
+        return self._ner_pipeline
+    
+    def _load_ner_pipeline(self, model_name: str):
+        """
+        Load the NER pipeline in the cheapest form available: FP16 on GPU,
+        int8-quantized ONNX on CPU, else the stock FP32 transformers model
+        """
+        kwargs = {"aggregation_strategy": "simple", "batch_size": NER_BATCH_SIZE}
+        
+        if settings.USE_GPU:
+            import torch
+            if torch.cuda.is_available():
+                model = AutoModelForTokenClassification.from_pretrained(
+                    model_name, torch_dtype=torch.float16
+                )
+                tokenizer = AutoTokenizer.from_pretrained(model_name)
+                logger.info(f"[GEO] NER model loaded (FP16, GPU): {model_name}")
+                return pipeline("ner", model=model, tokenizer=tokenizer, device=0, **kwargs)
+        
+        if ONNXRUNTIME_AVAILABLE:
+            try:
+                model = self._load_quantized_onnx(model_name)
+                tokenizer = AutoTokenizer.from_pretrained(model_name)
+                logger.info(f"[GEO] NER model loaded (int8 ONNX, CPU): {model_name}")
+                return pipeline("ner", model=model, tokenizer=tokenizer, **kwargs)
+            except Exception as e:
+                logger.warning(f"[GEO] ONNX NER export failed: {e}. Using the transformers model.")
+        
+        ner = pipeline("ner", model=model_name, **kwargs)
+        logger.info(f"[GEO] NER model loaded: {model_name}")
+        return ner
+    
+    @staticmethod
+    def _load_quantized_onnx(model_name: str):
+        """Export + dynamically quantize the NER model once, then reuse it from disk"""
+        onnx_dir = os.path.join(settings.MODEL_CACHE_DIR or "./models", "geo_ner_onnx_int8")
+        quantized_file = "model_quantized.onnx"
+        
+        if not os.path.exists(os.path.join(onnx_dir, quantized_file)):
+            exported = ORTModelForTokenClassification.from_pretrained(model_name, export=True)
+            quantizer = ORTQuantizer.from_pretrained(exported)
+            qconfig = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            quantizer.quantize(save_dir=onnx_dir, quantization_config=qconfig)
+        
+        return ORTModelForTokenClassification.from_pretrained(onnx_dir, file_name=quantized_file)
     
     def extract_locations_ner(self, text: str) -> List[Tuple[str, int]]:
         """Extract location entities using NER model"""
         if not self.ner_pipeline or not text:
             return []
         
+        key = text[:512]  # Limit text length
+        cached = self._ner_cache_get(key)
+        if cached is not None:
+            return list(cached)
+        
         try:
-            entities = self.ner_pipeline(text[:512])  # Limit text length
-            locations = []
-            
-            for entity in entities:
-                if entity['entity_group'] in ['LOC', 'GPE', 'LOCATION']:
-                    location = entity['word'].strip().lower()
-                    position = entity['start']
-                    locations.append((location, position))
-            
-            return locations
+            locations = _locations_from_entities(self.ner_pipeline(key))
         except Exception as e:
             logger.error(f"[GEO] NER extraction failed: {e}")
             return []
+        self._ner_cache_put(key, locations)
+        return locations
     
-    def extract_locations_keyword(self, text: str) -> List[Tuple[str, int]]:
-        """Extract locations using keyword matching"""
-        if not text:
-            return []
+    def extract_locations_ner_batch(self, texts: List[str]) -> List[List[Tuple[str, int]]]:
+        """
+        Extract location entities for many texts with batched NER passes.
+        Texts are fed shortest first so each batch pads to a similar length;
+        results come back in input order.
+        """
+        results: List[List[Tuple[str, int]]] = [[] for _ in texts]
+        if not self.ner_pipeline:
+            return results
         
-        text_lower = text.lower()
-        locations = []
+        # Serve repeats from the cache; only misses go through the model
+        misses = []
+        for i, text in enumerate(texts):
+            if not text:
+                continue
+            cached = self._ner_cache_get(text[:512])
+            if cached is not None:
+                results[i] = list(cached)
+            else:
+                misses.append(i)
         
-        # Check for cities
-        for city, state in CITY_STATE_MAP.items():
-            pos = text_lower.find(city)
-            if pos != -1:
-                locations.append((city, pos))
+        order = sorted(misses, key=lambda i: len(texts[i]))
+        try:
+            outputs = self.ner_pipeline(
+                (texts[i][:512] for i in order), batch_size=NER_BATCH_SIZE
+            )
+            for i, entities in zip(order, outputs):
+                results[i] = _locations_from_entities(entities)
+                self._ner_cache_put(texts[i][:512], results[i])
+        except Exception as e:
+            logger.error(f"[GEO] Batched NER extraction failed: {e}")
+        return results
+    
+    def _ner_cache_get(self, key: str) -> Optional[Tuple[Tuple[str, int], ...]]:
+        cached = self._ner_cache.get(key)
+        if cached is not None:
+            self._ner_cache.move_to_end(key)
+        return cached
+    
+    def _ner_cache_put(self, key: str, locations: List[Tuple[str, int]]):
+        self._ner_cache[key] = tuple(locations)
+        if len(self._ner_cache) > NER_CACHE_SIZE:
+            self._ner_cache.popitem(last=False)
+    
+    def extract_locations_keyword(self, text_lower: str) -> List[Tuple[str, int]]:
+        """Extract locations using keyword matching (expects already-lowercased text)"""
+        if not text_lower:
+            return []
         
-        # Check for states
-        for state_var, state in STATE_VARIATIONS.items():
-            pos = text_lower.find(state_var)
-            if pos != -1:
-                locations.append((state_var, pos))
+        # Keep the first whole-word hit of each keyword
+        first_seen = {}
+        if AHOCORASICK_AVAILABLE:
+            for end, keyword in _get_keyword_automaton().iter(text_lower):
+                start = end - len(keyword) + 1
+                if keyword in first_seen:
+                    continue
+                if start > 0 and _is_word_char(text_lower[start - 1]):
+                    continue
+                if end + 1 < len(text_lower) and _is_word_char(text_lower[end + 1]):
+                    continue
+                first_seen[keyword] = start
+        else:
+            for match in _KEYWORD_RE.finditer(text_lower):
+                first_seen.setdefault(match.group(1), match.start())
         
-        return locations
+        return list(first_seen.items())
     
     def map_to_state(self, location: str) -> Optional[str]:
         """Map location to state"""
-        location_lower = location.lower().strip()
-        
-        # Direct city match
-        if location_lower in CITY_STATE_MAP:
-            return CITY_STATE_MAP[location_lower]
-        
-        # State name match
-        if location_lower in STATE_VARIATIONS:
-            return STATE_VARIATIONS[location_lower]
+        return self._map_to_state_fast(location.lower().strip())
+    
+    def _map_to_state_fast(self, location_lower: str) -> Optional[str]:
+        """map_to_state for a location that is already lowercased and stripped"""
+        state = _SURFACE_TO_STATE.get(location_lower)
+        if state:
+            return state
         
-        # Partial match for cities
-        for city, state in CITY_STATE_MAP.items():
-            if city in location_lower or location_lower in city:
+        # Partial match ("mumbai city", "tamil nadu state"): look up each word
+        # and each adjacent word pair instead of scanning every city
+        words = location_lower.split()
+        for i, word in enumerate(words):
+            state = _SURFACE_TO_STATE.get(word)
+            if not state and i + 1 < len(words):
+                state = _SURFACE_TO_STATE.get(f"{word} {words[i + 1]}")
+            if state:
                 return state
         
         return None
     
-    def classify(self, text: str, title: str = "") -> Optional[str]:
+    def classify(self, text: str, title: str = "", headline: bool = False) -> Optional[str]:
         """
         Classify article to a state based on location entities
         Returns state name or None
+        
+        A confident keyword hit in the title skips NER; pass headline=True
+        when text itself is a title or summary
         """
         if not text and not title:
             return None
@@ -224,14 +402,46 @@ class GeoClassifier:
         # Combine title and text, prioritize title
         combined_text = f"{title} {text}" if title else text
         
-        # Extract locations using both methods
-        locations = []
+        # NER and keyword hits both come back lowercased, so lower the text once
+        keyword_locations = self.extract_locations_keyword(combined_text.lower())
         
-        if self.use_ner:
-            locations.extend(self.extract_locations_ner(combined_text))
+        if not self.use_ner:
+            return self._first_state(keyword_locations)
         
-        locations.extend(self.extract_locations_keyword(combined_text))
+        # An explicit city/state name in the headline settles it; one further
+        # down the body may be a passing mention, so NER still gets a say
+        headline_locations = (
+            keyword_locations if headline
+            else [(keyword, pos) for keyword, pos in keyword_locations if pos < len(title)]
+        )
+        if _has_confident_keyword(headline_locations):
+            return self._first_state(keyword_locations)
         
+        return self._first_state(self.extract_locations_ner(combined_text) + keyword_locations)
+    
+    def classify_batch(self, texts: List[str], headlines: bool = False) -> List[Optional[str]]:
+        """
+        classify() for many texts at once; NER runs as batched forward
+        passes instead of one pass per text. With headlines=True (titles or
+        summaries) a confident keyword hit skips NER for that text
+        """
+        keyword_locations = [self.extract_locations_keyword(text.lower()) if text else [] for text in texts]
+        states: List[Optional[str]] = [self._first_state(hits) for hits in keyword_locations]
+        if not self.use_ner:
+            return states
+        
+        # Only texts without a conclusive headline keyword hit go through NER
+        pending = [
+            i for i, text in enumerate(texts)
+            if text and not (headlines and _has_confident_keyword(keyword_locations[i]))
+        ]
+        ner_locations = self.extract_locations_ner_batch([texts[i] for i in pending])
+        for i, locations in zip(pending, ner_locations):
+            states[i] = self._first_state(locations + keyword_locations[i])
+        return states
+    
+    def _first_state(self, locations: List[Tuple[str, int]]) -> Optional[str]:
+        """Map the earliest location that resolves to a state"""
         if not locations:
             return None
         
@@ -240,7 +450,7 @@ class GeoClassifier:
         
         # Try to map each location to a state
         for location, position in locations:
-            state = self.map_to_state(location)
+            state = self._map_to_state_fast(location)
             if state:
                 logger.info(f"[GEO] Detected: '{location}' → {state} (pos: {position})")
                 return state
@@ -271,12 +481,12 @@ def classify_article_region(article_dict: Dict) -> Optional[str]:
     summary = article_dict.get('summary', '')
     
     # Try title first (most relevant)
-    state = classifier.classify(title)
+    state = classifier.classify(title, headline=True)
     if state:
         return state
     
     # Try summary
-    state = classifier.classify(summary)
+    state = classifier.classify(summary, headline=True)
     if state:
         return state
     
@@ -287,3 +497,25 @@ def classify_article_region(article_dict: Dict) -> Optional[str]:
             return state
     
     return None
+
+
+def classify_articles_region(article_dicts: List[Dict]) -> List[Optional[str]]:
+    """
+    classify_article_region() for a batch of articles: titles, then the
+    summaries and content of the still-unresolved articles, each as one
+    classify_batch() call
+    """
+    classifier = get_geo_classifier()
+    regions: List[Optional[str]] = [None] * len(article_dicts)
+    
+    def fields(name, limit=None, headlines=False):
+        pending = [i for i, region in enumerate(regions) if region is None]
+        texts = [(article_dicts[i].get(name) or '')[:limit] for i in pending]
+        for i, state in zip(pending, classifier.classify_batch(texts, headlines)):
+            regions[i] = state
+    
+    # Title first (most relevant), then summary, then content (first 1000 chars)
+    fields('title', headlines=True)
+    fields('summary', headlines=True)
+    fields('content', 1000)
+    return regions
@@ -4,13 +4,26 @@ Live maps showing government news heat zones, scheme coverage, ministry activity
 """
 
 import logging
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
-from collections import defaultdict
+from collections import Counter
 
 logger = logging.getLogger(__name__)
 
 
+def _array_literal(value: str) -> str:
+    """
+    One-element Postgres array literal ('{"value"}') for `col @> %s`.
+
+    Passed as an untyped string so Postgres reads it as the column's own
+    array type (text[] or varchar[]), which lets the containment use the
+    GIN index; `%s = ANY(col)` cannot.
+    """
+    escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+    return '{"' + escaped + '"}'
+
+
 class GeoIntelligence:
     """Analyze geographic distribution of government news"""
     
@@ -54,9 +67,35 @@ class GeoIntelligence:
         "Puducherry": {"lat": 11.9416, "lng": 79.8083}
     }
     
+    # GeoJSON Point geometry per state, built once for the feature builders
+    STATE_GEOMETRY = {
+        name: {"type": "Point", "coordinates": (coords["lng"], coords["lat"])}
+        for name, coords in STATE_COORDINATES.items()
+    }
+    
     def __init__(self, db):
         self.db = db
     
+    @contextmanager
+    def _cursor(self):
+        """
+        Cursor on a pooled connection. A Database hands out a connection
+        from its shared engine pool (returned on exit); anything else is
+        treated as a DB-API connection.
+        """
+        engine = getattr(self.db, "engine", None)
+        if engine is None:
+            with self.db.cursor() as cur:
+                yield cur
+            return
+        
+        conn = engine.raw_connection()
+        try:
+            with conn.cursor() as cur:
+                yield cur
+        finally:
+            conn.close()  # back to the pool
+    
     def get_heat_map_data(
         self,
         days: int = 30,
@@ -76,54 +115,50 @@ class GeoIntelligence:
         start_date = datetime.now() - timedelta(days=days)
         
         try:
-            # Get article counts by region
+            # Article counts by region from the daily rollup (migration 20)
+            # rather than aggregating every article in the window
             query = """
                 SELECT 
                     detected_region,
-                    COUNT(*) as article_count,
-                    AVG(confidence_score) as avg_confidence,
-                    AVG(sentiment_score) as avg_sentiment,
-                    COUNT(DISTINCT source_name) as unique_sources
-                FROM articles
-                WHERE is_goi = TRUE
-                  AND created_at >= %s
-                  AND detected_region IS NOT NULL
-                  AND detected_region != 'India'
+                    SUM(article_count)::bigint as article_count,
+                    SUM(confidence_sum) / NULLIF(SUM(confidence_n), 0) as avg_confidence,
+                    SUM(sentiment_sum) / NULLIF(SUM(sentiment_n), 0) as avg_sentiment,
+                    COUNT(DISTINCT NULLIF(source_name, '')) as unique_sources,
+                    (MAX(SUM(article_count)) OVER ())::bigint as max_count
+                FROM geo_daily_agg
+                WHERE day >= date_trunc('day', %s::timestamp)
                 GROUP BY detected_region
-                HAVING COUNT(*) >= %s
+                HAVING SUM(article_count) >= %s
             """
             
-            with self.db.cursor() as cur:
+            with self._cursor() as cur:
                 cur.execute(query, (start_date, min_articles))
                 
                 features = []
                 max_count = 0
                 
-                for row in cur.fetchall():
+                for row in cur:
                     region = row[0]
                     article_count = row[1]
                     avg_confidence = row[2]
                     avg_sentiment = row[3]
                     unique_sources = row[4]
-                    
-                    max_count = max(max_count, article_count)
+                    max_count = row[5]
                     
                     # Get coordinates
-                    coords = self.STATE_COORDINATES.get(region)
-                    if coords:
+                    geometry = self.STATE_GEOMETRY.get(region)
+                    if geometry:
                         features.append({
                             "type": "Feature",
-                            "geometry": {
-                                "type": "Point",
-                                "coordinates": [coords["lng"], coords["lat"]]
-                            },
+                            "geometry": geometry,
                             "properties": {
                                 "name": region,
                                 "article_count": article_count,
-                                "avg_confidence": round(avg_confidence, 2) if avg_confidence else None,
-                                "avg_sentiment": round(avg_sentiment, 2) if avg_sentiment else None,
+                                "avg_confidence": round(float(avg_confidence), 2) if avg_confidence else None,
+                                "avg_sentiment": round(float(avg_sentiment), 2) if avg_sentiment else None,
                                 "unique_sources": unique_sources,
-                                "heat_intensity": self._calculate_heat_intensity(article_count, max_count)
+                                # Share of the busiest state's count (0.0-1.0)
+                                "heat_intensity": min(article_count / max_count, 1.0) if max_count else 0.0
                             }
                         })
                 
@@ -142,12 +177,6 @@ class GeoIntelligence:
             logger.error(f"Error generating heat map: {e}")
             return {"type": "FeatureCollection", "features": [], "error": str(e)}
     
-    def _calculate_heat_intensity(self, count: int, max_count: int) -> float:
-        """Calculate heat intensity (0.0-1.0) for visualization"""
-        if max_count == 0:
-            return 0.0
-        return min(count / max_count, 1.0)
-    
     def get_scheme_coverage_map(
         self,
         scheme: str,
@@ -167,58 +196,71 @@ class GeoIntelligence:
         start_date = datetime.now() - timedelta(days=days)
         
         try:
+            # Ministries are unnested and ranked in SQL, so each row carries
+            # its top 3 ministries instead of an array of arrays
             query = """
+                WITH scoped AS (
+                    SELECT detected_region, confidence_score, sentiment_score,
+                           goi_ministries, created_at
+                    FROM articles
+                    WHERE is_goi = TRUE
+                      AND created_at >= %s
+                      AND goi_schemes @> %s
+                      AND detected_region IS NOT NULL
+                      AND detected_region != 'India'
+                ),
+                ministry_mentions AS (
+                    SELECT detected_region, ministry, COUNT(*) as mentions
+                    FROM scoped, unnest(goi_ministries) as ministry
+                    WHERE ministry IS NOT NULL
+                    GROUP BY detected_region, ministry
+                ),
+                top_ministries AS (
+                    SELECT detected_region,
+                           (array_agg(ministry ORDER BY mentions DESC, ministry))[1:3] as ministries
+                    FROM ministry_mentions
+                    GROUP BY detected_region
+                )
                 SELECT 
-                    detected_region,
+                    s.detected_region,
                     COUNT(*) as article_count,
-                    AVG(confidence_score) as avg_confidence,
-                    AVG(sentiment_score) as avg_sentiment,
-                    array_agg(DISTINCT goi_ministries) as ministries,
-                    MIN(created_at) as first_mention,
-                    MAX(created_at) as latest_mention
-                FROM articles
-                WHERE is_goi = TRUE
-                  AND created_at >= %s
-                  AND %s = ANY(goi_schemes)
-                  AND detected_region IS NOT NULL
-                  AND detected_region != 'India'
-                GROUP BY detected_region
+                    AVG(s.confidence_score) as avg_confidence,
+                    AVG(s.sentiment_score) as avg_sentiment,
+                    t.ministries,
+                    MIN(s.created_at) as first_mention,
+                    MAX(s.created_at) as latest_mention
+                FROM scoped s
+                LEFT JOIN top_ministries t ON t.detected_region = s.detected_region
+                GROUP BY s.detected_region, t.ministries
             """
             
-            with self.db.cursor() as cur:
-                cur.execute(query, (start_date, scheme))
+            with self._cursor() as cur:
+                cur.execute(query, (start_date, _array_literal(scheme)))
                 
                 features = []
                 
-                for row in cur.fetchall():
+                for row in cur:
                     region = row[0]
-                    coords = self.STATE_COORDINATES.get(region)
+                    geometry = self.STATE_GEOMETRY.get(region)
                     
-                    if coords:
-                        # Flatten ministries array
-                        ministries = []
-                        if row[4]:
-                            for ministry_array in row[4]:
-                                if ministry_array:
-                                    ministries.extend(ministry_array)
-                        unique_ministries = list(set(ministries))
-                        
+                    if geometry:
                         features.append({
                             "type": "Feature",
-                            "geometry": {
-                                "type": "Point",
-                                "coordinates": [coords["lng"], coords["lat"]]
-                            },
+                            "geometry": geometry,
                             "properties": {
                                 "name": region,
                                 "scheme": scheme,
                                 "article_count": row[1],
-                                "avg_confidence": round(row[2], 2) if row[2] else None,
-                                "avg_sentiment": round(row[3], 2) if row[3] else None,
-                                "ministries": unique_ministries[:3],  # Top 3
+                                "avg_confidence": round(float(row[2]), 2) if row[2] else None,
+                                "avg_sentiment": round(float(row[3]), 2) if row[3] else None,
+                                "ministries": row[4] or [],  # Top 3
                                 "first_mention": row[5].isoformat() if row[5] else None,
                                 "latest_mention": row[6].isoformat() if row[6] else None,
-                                "coverage_status": self._determine_coverage_status(row[1], row[2])
+                                "coverage_status": (
+                                    "high_coverage" if row[1] >= 10 and (row[2] or 0) >= 0.7
+                                    else "medium_coverage" if row[1] >= 5
+                                    else "low_coverage"
+                                )
                             }
                         })
                 
@@ -237,16 +279,6 @@ class GeoIntelligence:
             logger.error(f"Error generating scheme coverage map: {e}")
             return {"type": "FeatureCollection", "features": [], "error": str(e)}
     
-    def _determine_coverage_status(self, article_count: int, avg_confidence: float) -> str:
-        """Determine coverage status for a region"""
-        
-        if article_count >= 10 and (avg_confidence or 0) >= 0.7:
-            return "high_coverage"
-        elif article_count >= 5:
-            return "medium_coverage"
-        else:
-            return "low_coverage"
-    
     def get_ministry_footprint(
         self,
         ministry: str,
@@ -266,46 +298,56 @@ class GeoIntelligence:
         start_date = datetime.now() - timedelta(days=days)
         
         try:
+            # Schemes are unnested and ranked in SQL (top 5 per region)
             query = """
+                WITH scoped AS (
+                    SELECT detected_region, sentiment_score, goi_schemes
+                    FROM articles
+                    WHERE is_goi = TRUE
+                      AND created_at >= %s
+                      AND goi_ministries @> %s
+                      AND detected_region IS NOT NULL
+                      AND detected_region != 'India'
+                ),
+                scheme_mentions AS (
+                    SELECT detected_region, scheme, COUNT(*) as mentions
+                    FROM scoped, unnest(goi_schemes) as scheme
+                    WHERE scheme IS NOT NULL
+                    GROUP BY detected_region, scheme
+                ),
+                top_schemes AS (
+                    SELECT detected_region,
+                           (array_agg(scheme ORDER BY mentions DESC, scheme))[1:5] as schemes
+                    FROM scheme_mentions
+                    GROUP BY detected_region
+                )
                 SELECT 
-                    detected_region,
+                    s.detected_region,
                     COUNT(*) as article_count,
-                    array_agg(DISTINCT goi_schemes) as schemes,
-                    AVG(sentiment_score) as avg_sentiment
-                FROM articles
-                WHERE is_goi = TRUE
-                  AND created_at >= %s
-                  AND %s = ANY(goi_ministries)
-                  AND detected_region IS NOT NULL
-                  AND detected_region != 'India'
-                GROUP BY detected_region
+                    t.schemes,
+                    AVG(s.sentiment_score) as avg_sentiment
+                FROM scoped s
+                LEFT JOIN top_schemes t ON t.detected_region = s.detected_region
+                GROUP BY s.detected_region, t.schemes
                 ORDER BY article_count DESC
             """
             
-            with self.db.cursor() as cur:
-                cur.execute(query, (start_date, ministry))
+            with self._cursor() as cur:
+                cur.execute(query, (start_date, _array_literal(ministry)))
                 
                 footprint = []
                 
-                for row in cur.fetchall():
+                for row in cur:
                     region = row[0]
                     coords = self.STATE_COORDINATES.get(region)
                     
                     if coords:
-                        # Flatten schemes
-                        schemes = []
-                        if row[2]:
-                            for scheme_array in row[2]:
-                                if scheme_array:
-                                    schemes.extend(scheme_array)
-                        unique_schemes = list(set(schemes))
-                        
                         footprint.append({
                             "region": region,
                             "coordinates": coords,
                             "article_count": row[1],
-                            "schemes": unique_schemes[:5],  # Top 5
-                            "avg_sentiment": round(row[3], 2) if row[3] else None
+                            "schemes": row[2] or [],  # Top 5
+                            "avg_sentiment": round(float(row[3]), 2) if row[3] else None
                         })
                 
                 return {
@@ -347,7 +389,7 @@ class GeoIntelligence:
                     COUNT(*) as article_count,
                     AVG(sentiment_score) as avg_sentiment,
                     array_agg(content_category) as categories,
-                    array_agg(title ORDER BY created_at DESC) as recent_titles
+                    (array_agg(title ORDER BY created_at DESC))[1:3] as recent_titles
                 FROM articles
                 WHERE is_goi = TRUE
                   AND created_at >= %s
@@ -359,29 +401,24 @@ class GeoIntelligence:
                 ORDER BY AVG(sentiment_score) ASC
             """
             
-            with self.db.cursor() as cur:
+            with self._cursor() as cur:
                 cur.execute(query, (start_date, sentiment_threshold, min_articles))
                 
                 crisis_zones = []
                 
-                for row in cur.fetchall():
-                    # Count category occurrences
-                    categories = row[3] or []
-                    category_counts = defaultdict(int)
-                    for cat in categories:
-                        if cat:
-                            category_counts[cat] += 1
-                    
-                    top_category = max(category_counts.items(), key=lambda x: x[1])[0] if category_counts else "Unknown"
+                for row in cur:
+                    # Most frequent category
+                    categories = [cat for cat in (row[3] or []) if cat]
+                    top_category = Counter(categories).most_common(1)[0][0] if categories else "Unknown"
                     
                     crisis_zones.append({
                         "region": row[0],
                         "severity": "high" if row[2] < -0.7 else "medium",
                         "article_count": row[1],
-                        "avg_sentiment": round(row[2], 2),
+                        "avg_sentiment": round(float(row[2]), 2),
                         "primary_issue": top_category,
-                        "recent_headlines": row[4][:3] if row[4] else [],
-                        "alert_message": f"⚠️ {row[0]}: {row[1]} negative articles about {top_category} (sentiment: {round(row[2], 2)})"
+                        "recent_headlines": row[4] or [],
+                        "alert_message": f"⚠️ {row[0]}: {row[1]} negative articles about {top_category} (sentiment: {round(float(row[2]), 2)})"
                     })
                 
                 return crisis_zones
@@ -415,48 +452,58 @@ class GeoIntelligence:
         }
         
         try:
-            for region in regions:
-                query = """
-                    SELECT 
-                        COUNT(*) as total_articles,
-                        AVG(confidence_score) as avg_confidence,
-                        AVG(sentiment_score) as avg_sentiment,
-                        array_agg(DISTINCT goi_schemes) as schemes,
-                        array_agg(DISTINCT goi_ministries) as ministries,
-                        COUNT(DISTINCT content_category) as unique_categories
+            # One grouped query for all regions instead of one round trip each;
+            # distinct schemes/ministries are counted in SQL from the unnested arrays
+            query = """
+                WITH scoped AS (
+                    SELECT detected_region, confidence_score, sentiment_score,
+                           goi_schemes, goi_ministries, content_category
                     FROM articles
                     WHERE is_goi = TRUE
                       AND created_at >= %s
-                      AND detected_region = %s
-                """
+                      AND detected_region = ANY(%s)
+                ),
+                scheme_counts AS (
+                    SELECT detected_region, COUNT(DISTINCT scheme) as unique_schemes
+                    FROM scoped, unnest(goi_schemes) as scheme
+                    GROUP BY detected_region
+                ),
+                ministry_counts AS (
+                    SELECT detected_region, COUNT(DISTINCT ministry) as unique_ministries
+                    FROM scoped, unnest(goi_ministries) as ministry
+                    GROUP BY detected_region
+                )
+                SELECT 
+                    s.detected_region,
+                    COUNT(*) as total_articles,
+                    AVG(s.confidence_score) as avg_confidence,
+                    AVG(s.sentiment_score) as avg_sentiment,
+                    COALESCE(sc.unique_schemes, 0) as unique_schemes,
+                    COALESCE(mc.unique_ministries, 0) as unique_ministries,
+                    COUNT(DISTINCT s.content_category) as unique_categories
+                FROM scoped s
+                LEFT JOIN scheme_counts sc ON sc.detected_region = s.detected_region
+                LEFT JOIN ministry_counts mc ON mc.detected_region = s.detected_region
+                GROUP BY s.detected_region, sc.unique_schemes, mc.unique_ministries
+            """
+            
+            with self._cursor() as cur:
+                cur.execute(query, (start_date, list(regions)))
+                rows_by_region = {row[0]: row[1:] for row in cur}
+            
+            for region in regions:
+                # Regions without articles still get a zero row
+                row = rows_by_region.get(region, (0, None, None, 0, 0, 0))
                 
-                with self.db.cursor() as cur:
-                    cur.execute(query, (start_date, region))
-                    row = cur.fetchone()
-                    
-                    if row:
-                        # Flatten arrays
-                        schemes = []
-                        if row[3]:
-                            for scheme_array in row[3]:
-                                if scheme_array:
-                                    schemes.extend(scheme_array)
-                        
-                        ministries = []
-                        if row[4]:
-                            for ministry_array in row[4]:
-                                if ministry_array:
-                                    ministries.extend(ministry_array)
-                        
-                        comparison["comparison_data"].append({
-                            "region": region,
-                            "total_articles": row[0],
-                            "avg_confidence": round(row[1], 2) if row[1] else None,
-                            "avg_sentiment": round(row[2], 2) if row[2] else None,
-                            "unique_schemes": len(set(schemes)),
-                            "unique_ministries": len(set(ministries)),
-                            "unique_categories": row[5]
-                        })
+                comparison["comparison_data"].append({
+                    "region": region,
+                    "total_articles": row[0],
+                    "avg_confidence": round(float(row[1]), 2) if row[1] else None,
+                    "avg_sentiment": round(float(row[2]), 2) if row[2] else None,
+                    "unique_schemes": row[3],
+                    "unique_ministries": row[4],
+                    "unique_categories": row[5]
+                })
             
             # Add insights
             if comparison["comparison_data"]:
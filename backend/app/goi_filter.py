@@ -910,10 +910,24 @@ EXCLUSION_KEYWORDS = {
     ],
 }
 
-# Precompile patterns
-GOI_PATTERNS: Dict[str, List[re.Pattern]] = {
-    lang: [re.compile(r"\b" + re.escape(k) + r"\b", re.IGNORECASE) for k in keys]
-    for lang, keys in GOI_KEYWORDS.items()
+def _keyword_alternation(keys: List[str]) -> re.Pattern:
+    """
+    One case-insensitive whole-word alternation of keys, longest first.
+    search() matches exactly when one of the per-key whole-word patterns would.
+    """
+    return re.compile(
+        r"\b(?:" + "|".join(re.escape(k) for k in sorted(keys, key=len, reverse=True)) + r")\b",
+        re.IGNORECASE,
+    )
+
+
+# Precompile patterns: one regex scan per language instead of one search() per keyword
+GOI_REGEX: Dict[str, re.Pattern] = {
+    lang: _keyword_alternation(keys) for lang, keys in GOI_KEYWORDS.items() if keys
+}
+# The English/Hindi path only looks at the first 100 keywords of each list
+GOI_REGEX_HEAD: Dict[str, re.Pattern] = {
+    lang: _keyword_alternation(GOI_KEYWORDS[lang][:100]) for lang in ("en", "hi")
 }
 STATE_PATTERNS: Dict[str, List[re.Pattern]] = {
     lang: [re.compile(r"\b" + re.escape(k) + r"\b", re.IGNORECASE) for k in keys]
@@ -1024,18 +1038,17 @@ def stage2_keyword_filter(text: str, detected_lang: str | None) -> bool:
     # CRITICAL FIX: For regional languages, be more lenient
     if detected_lang and detected_lang not in ['en', 'hi']:
         # Check language-specific patterns (ALL patterns for better coverage)
-        patterns = GOI_PATTERNS.get(detected_lang, [])
-        if patterns and any(p.search(text) for p in patterns):  # Check ALL patterns
+        pattern = GOI_REGEX.get(detected_lang)
+        if pattern and pattern.search(text):  # Check ALL patterns
             return True
         
         # Check ALL English patterns (regional media often uses English terms)
-        en_patterns = GOI_PATTERNS.get('en', [])
-        if any(p.search(text) for p in en_patterns):  # Check ALL English patterns
+        if GOI_REGEX['en'].search(text):  # Check ALL English patterns
             return True
         
         # Check ALL Hindi patterns (widely used across India)
-        hi_patterns = GOI_PATTERNS.get('hi', [])
-        if hi_patterns and any(p.search(text) for p in hi_patterns):  # Check ALL Hindi patterns
+        pattern = GOI_REGEX.get('hi')
+        if pattern and pattern.search(text):  # Check ALL Hindi patterns
             return True
         
         # Check for ALL ministry/scheme names from gazetteers
@@ -1053,8 +1066,8 @@ def stage2_keyword_filter(text: str, detected_lang: str | None) -> bool:
     for lang in (detected_lang, "en", "hi"):
         if not lang:
             continue
-        patterns = GOI_PATTERNS.get(lang, [])
-        if patterns and any(p.search(text) for p in patterns[:100]):  # Check first 100 patterns
+        pattern = GOI_REGEX_HEAD.get(lang)
+        if pattern and pattern.search(text):  # Check first 100 patterns
             return True
     
     # Fallback: look for ministry/scheme names directly
@@ -4,28 +4,90 @@ Supports 10+ Indian languages: Hindi, Kannada, Tamil, Telugu, Bengali,
 Gujarati, Marathi, Punjabi, Malayalam, Odia, Urdu, English
 """
 from __future__ import annotations
+import hashlib
 import logging
-from typing import Optional, Dict, Any
+import os
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Optional, Dict, Any, List, Tuple
 from functools import lru_cache
 import re
+import threading
+import time
+
+from .config import settings
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from optimum.onnxruntime import ORTModelForSeq2SeqLM
+    ONNXRUNTIME_AVAILABLE = True
+except ImportError:
+    ONNXRUNTIME_AVAILABLE = False
+
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+_TAG_RE = re.compile(r'<[^>]+>')
+_WS_RE = re.compile(r'\s+')
+
+# Cleaned text of large HTML inputs, keyed by content digest (detect, translate
+# and batch-translate often clean the same article body more than once)
+CLEAN_HTML_CACHE_SIZE = 512
+CLEAN_HTML_CACHE_MIN_CHARS = 1024
+_clean_html_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
 def clean_html(text: str) -> str:
     """Remove HTML tags and clean text for translation"""
+    if not text or len(text) < CLEAN_HTML_CACHE_MIN_CHARS:
+        return _clean_html_impl(text)
+    
+    key = hashlib.blake2b(text.encode('utf-8', 'replace'), digest_size=16).digest()
+    cached = _clean_html_cache.get(key)
+    if cached is not None:
+        _clean_html_cache.move_to_end(key)
+        return cached
+    
+    clean_text = _clean_html_impl(text)
+    _clean_html_cache[key] = clean_text
+    if len(_clean_html_cache) > CLEAN_HTML_CACHE_SIZE:
+        _clean_html_cache.popitem(last=False)
+    return clean_text
+
+def _clean_html_impl(text: str) -> str:
     if not text:
         return text
     
-    try:
-        from bs4 import BeautifulSoup
-        soup = BeautifulSoup(text, 'html.parser')
-        clean_text = soup.get_text(separator=' ', strip=True)
-    except:
-        # Fallback to regex if BeautifulSoup fails
-        clean_text = re.sub(r'<[^>]+>', '', text)
+    if '<' not in text and '&' not in text:
+        # Plain text: nothing to parse
+        clean_text = text
+    else:
+        try:
+            if LXML_AVAILABLE:
+                # libxml2 parser; same text as BeautifulSoup's get_text(separator=' ')
+                root = lxml.html.fromstring(text)
+                etree.strip_elements(root, 'script', 'style', with_tail=False)
+                clean_text = ' '.join(root.itertext())
+            else:
+                from bs4 import BeautifulSoup
+                soup = BeautifulSoup(text, 'html.parser')
+                clean_text = soup.get_text(separator=' ', strip=True)
+        except Exception:
+            # Fallback to regex if the parser fails
+            clean_text = _TAG_RE.sub('', text)
     
     # Clean up extra whitespace
-    clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+    clean_text = _WS_RE.sub(' ', clean_text).strip()
     return clean_text
 
 # Language codes mapping
@@ -44,19 +106,193 @@ INDIAN_LANGUAGES = {
     'en': 'English',
 }
 
-# Script detection patterns
-SCRIPT_PATTERNS = {
-    'Devanagari': ['ऀ', 'ँ', 'ं', 'ः', 'अ', 'आ', 'इ', 'ई', 'उ', 'ऊ', 'ऋ', 'ए', 'ऐ', 'ओ', 'औ', 'क', 'ख', 'ग', 'घ', 'ङ', 'च', 'छ', 'ज', 'झ', 'ञ', 'ट', 'ठ', 'ड', 'ढ', 'ण', 'त', 'थ', 'द', 'ध', 'न', 'प', 'फ', 'ब', 'भ', 'म', 'य', 'र', 'ल', 'व', 'श', 'ष', 'स', 'ह'],  # Hindi, Marathi
-    'Kannada': ['ಅ', 'ಆ', 'ಇ', 'ಈ', 'ಉ', 'ಊ', 'ಋ', 'ೠ', 'ಎ', 'ಏ', 'ಐ', 'ಒ', 'ಓ', 'ಔ', 'ಕ', 'ಖ', 'ಗ', 'ಘ', 'ಙ', 'ಚ', 'ಛ', 'ಜ', 'ಝ', 'ಞ', 'ಟ', 'ಠ', 'ಡ', 'ಢ', 'ಣ', 'ತ', 'ಥ', 'ದ', 'ಧ', 'ನ', 'ಪ', 'ಫ', 'ಬ', 'ಭ', 'ಮ', 'ಯ', 'ರ', 'ಲ', 'ವ', 'ಶ', 'ಷ', 'ಸ', 'ಹ', 'ಳ'],
-    'Tamil': ['அ', 'ஆ', 'இ', 'ஈ', 'உ', 'ஊ', 'எ', 'ஏ', 'ஐ', 'ஒ', 'ஓ', 'ஔ', 'க', 'ங', 'ச', 'ஜ', 'ஞ', 'ட', 'ண', 'த', 'ந', 'ன', 'ப', 'ம', 'ய', 'ர', 'ற', 'ல', 'ள', 'ழ', 'வ', 'ஶ', 'ஷ', 'ஸ', 'ஹ'],
-    'Telugu': ['అ', 'ఆ', 'ఇ', 'ఈ', 'ఉ', 'ఊ', 'ఋ', 'ౠ', 'ఎ', 'ఏ', 'ఐ', 'ఒ', 'ఓ', 'ఔ', 'క', 'ఖ', 'గ', 'ఘ', 'ఙ', 'చ', 'ఛ', 'జ', 'ఝ', 'ఞ', 'ట', 'ఠ', 'డ', 'ఢ', 'ణ', 'త', 'థ', 'ద', 'ధ', 'న', 'ప', 'ఫ', 'బ', 'భ', 'మ', 'య', 'ర', 'ఱ', 'ల', 'ళ', 'వ', 'శ', 'ష', 'స', 'హ'],
-    'Bengali': ['অ', 'আ', 'ই', 'ঈ', 'উ', 'ঊ', 'ঋ', 'এ', 'ঐ', 'ও', 'ঔ', 'ক', 'খ', 'গ', 'ঘ', 'ঙ', 'চ', 'ছ', 'জ', 'ঝ', 'ঞ', 'ট', 'ঠ', 'ড', 'ঢ', 'ণ', 'ত', 'থ', 'দ', 'ধ', 'ন', 'প', 'ফ', 'ব', 'ভ', 'ম', 'য', 'র', 'ল', 'শ', 'ষ', 'স', 'হ', 'ড়', 'ঢ়', 'য়'],
-    'Gujarati': ['અ', 'આ', 'ઇ', 'ઈ', 'ઉ', 'ઊ', 'ઋ', 'એ', 'ઐ', 'ઓ', 'ઔ', 'ક', 'ખ', 'ગ', 'ઘ', 'ઙ', 'ચ', 'છ', 'જ', 'ઝ', 'ઞ', 'ટ', 'ઠ', 'ડ', 'ઢ', 'ણ', 'ત', 'થ', 'દ', 'ધ', 'ન', 'પ', 'ફ', 'બ', 'ભ', 'મ', 'ય', 'ર', 'લ', 'વ', 'શ', 'ષ', 'સ', 'હ', 'ળ'],
-    'Malayalam': ['അ', 'ആ', 'ഇ', 'ഈ', 'ഉ', 'ഊ', 'ഋ', 'ൠ', 'ഌ', 'ൡ', 'എ', 'ഏ', 'ഐ', 'ഒ', 'ഓ', 'ഔ', 'ക', 'ഖ', 'ഗ', 'ഘ', 'ങ', 'ച', 'ഛ', 'ജ', 'ഝ', 'ഞ', 'ട', 'ഠ', 'ഡ', 'ഢ', 'ണ', 'ത', 'ഥ', 'ദ', 'ധ', 'ന', 'പ', 'ഫ', 'ബ', 'ഭ', 'മ', 'യ', 'ര', 'ല', 'വ', 'ശ', 'ഷ', 'സ', 'ഹ', 'ള', 'ഴ', 'റ'],
-    'Odia': ['ଅ', 'ଆ', 'ଇ', 'ଈ', 'ଉ', 'ଊ', 'ଋ', 'ୠ', 'ଌ', 'ୡ', 'ଏ', 'ଐ', 'ଓ', 'ଔ', 'କ', 'ଖ', 'ଗ', 'ଘ', 'ଙ', 'ଚ', 'ଛ', 'ଜ', 'ଝ', 'ଞ', 'ଟ', 'ଠ', 'ଡ', 'ଢ', 'ଣ', 'ତ', 'ଥ', 'ଦ', 'ଧ', 'ନ', 'ପ', 'ଫ', 'ବ', 'ଭ', 'ମ', 'ଯ', 'ର', 'ଲ', 'ଳ', 'ଵ', 'ଶ', 'ଷ', 'ସ', 'ହ', 'ଡ଼', 'ଢ଼', 'ୟ'],
-    'Gurmukhi': ['ਅ', 'ਆ', 'ਇ', 'ਈ', 'ਉ', 'ਊ', 'ਏ', 'ਐ', 'ਓ', 'ਔ', 'ਕ', 'ਖ', 'ਗ', 'ਘ', 'ਙ', 'ਚ', 'ਛ', 'ਜ', 'ਝ', 'ਞ', 'ਟ', 'ਠ', 'ਡ', 'ਢ', 'ਣ', 'ਤ', 'ਥ', 'ਦ', 'ਧ', 'ਨ', 'ਪ', 'ਫ', 'ਬ', 'ਭ', 'ਮ', 'ਯ', 'ਰ', 'ਲ', 'ਲ਼', 'ਵ', 'ਸ਼', 'ਸ', 'ਹ'],  # Punjabi
+# Primary language per script
+SCRIPT_TO_LANG = {
+    'Devanagari': None,  # Ambiguous - could be Hindi or Marathi, use langdetect
+    'Kannada': 'kn',
+    'Tamil': 'ta',
+    'Telugu': 'te',
+    'Bengali': 'bn',
+    'Gujarati': 'gu',
+    'Malayalam': 'ml',
+    'Odia': 'or',
+    'Gurmukhi': 'pa',
+    'Latin': 'en',
+}
+
+# langdetect codes -> our codes; only these profiles are loaded
+LANGDETECT_MAP = {
+    'hi': 'hi', 'kn': 'kn', 'ta': 'ta', 'te': 'te',
+    'bn': 'bn', 'gu': 'gu', 'mr': 'mr', 'pa': 'pa',
+    'ml': 'ml', 'or': 'or', 'ur': 'ur', 'en': 'en',
+}
+
+
+def _load_langdetect_profiles(langdetect) -> None:
+    """
+    Install a langdetect factory holding only the LANGDETECT_MAP profiles.
+    langdetect loads all 55 bundled profiles by default; detection time and
+    memory grow with the number loaded, and other codes are discarded anyway.
+    """
+    from langdetect import detector_factory
+
+    if detector_factory._factory is not None:
+        return
+    
+    profiles = []
+    for code in LANGDETECT_MAP:
+        path = os.path.join(detector_factory.PROFILES_DIRECTORY, code)
+        if os.path.exists(path):  # langdetect ships no Odia profile
+            with open(path, encoding='utf-8') as f:
+                profiles.append(f.read())
+    
+    factory = detector_factory.DetectorFactory()
+    factory.load_json_profile(profiles)
+    detector_factory._factory = factory
+
+
+# Characters of (cleaned) text sent for translation
+MAX_TRANSLATION_CHARS = 5000
+
+# Texts per IndicTrans2 generate() call in translate_batch
+TRANSLATION_BATCH_SIZE = 16
+
+MYMEMORY_URL = "https://api.mymemory.translated.net/get"
+
+# Shared HTTP session for online translation fallbacks (keep-alive across calls)
+_session = None
+
+def _http_session():
+    global _session
+    if _session is None:
+        import requests
+        _session = requests.Session()
+    return _session
+
+
+# A translator that raises is skipped for this many seconds (circuit breaker)
+TRANSLATOR_COOLDOWN_SECONDS = 60.0
+_cooldown_until: Dict[str, float] = {}
+
+def _cooling_down(name: str) -> bool:
+    return time.monotonic() < _cooldown_until.get(name, 0.0)
+
+def _trip(name: str) -> None:
+    _cooldown_until[name] = time.monotonic() + TRANSLATOR_COOLDOWN_SECONDS
+
+
+# Seconds to wait on one online translation provider before also starting the next
+FALLBACK_HEDGE_SECONDS = 3.0
+
+_executor = None
+
+def _fallback_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=6, thread_name_prefix="translate-fallback")
+    return _executor
+
+
+def _via_deep_translator(text: str, source_lang: str) -> Optional[str]:
+    """MANDATORY Fallback 1: deep_translator (Google Translate API)"""
+    try:
+        from deep_translator import GoogleTranslator
+        translator = GoogleTranslator(source=source_lang, target='en')
+        result = translator.translate(text)
+        if result and len(result.strip()) > 10:
+            logger.info(f"✓ deep_translator (Google) fallback successful for {source_lang}")
+            return result.strip()
+    except ImportError:
+        logger.debug("deep_translator not installed, trying googletrans...")
+        _trip("deep_translator")
+    except Exception as e:
+        logger.warning(f"deep_translator failed for {source_lang}: {str(e)[:100]}")
+        _trip("deep_translator")
+    return None
+
+
+def _via_googletrans(text: str, source_lang: str) -> Optional[str]:
+    """MANDATORY Fallback 2: googletrans library"""
+    try:
+        from googletrans import Translator
+        translator = Translator()
+        result = translator.translate(text, src=source_lang, dest='en')
+        if result and result.text and len(result.text.strip()) > 10:
+            logger.info(f"✓ googletrans fallback successful for {source_lang}")
+            return result.text.strip()
+    except Exception as e:
+        logger.warning(f"googletrans failed for {source_lang}: {str(e)[:100]}")
+        _trip("googletrans")
+    return None
+
+
+def _via_mymemory(text: str, source_lang: str) -> Optional[str]:
+    """MANDATORY Fallback 3: MyMemory Translation API (free, no auth required)"""
+    try:
+        response = _http_session().get(
+            MYMEMORY_URL,
+            params={'q': text[:500], 'langpair': f"{source_lang}|en"},
+            timeout=10,
+        )
+        if response.status_code == 200:
+            data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+            translated = data.get('responseData', {}).get('translatedText', '')
+            if translated and len(translated.strip()) > 10:
+                logger.info(f"✓ MyMemory API fallback successful for {source_lang}")
+                return translated.strip()
+    except Exception as e:
+        logger.warning(f"MyMemory API failed for {source_lang}: {str(e)[:100]}")
+        _trip("mymemory")
+    return None
+
+
+_FALLBACK_PROVIDERS = [
+    ("deep_translator", _via_deep_translator),
+    ("googletrans", _via_googletrans),
+    ("mymemory", _via_mymemory),
+]
+
+
+# Distinct texts whose detect_language result is kept in memory
+DETECT_CACHE_SIZE = 4096
+
+# Texts at least this long are cached under a digest instead of the text itself
+DETECT_CACHE_KEY_CHARS = 256
+
+# _detect_script checks for a dominant script after every chunk of this many
+# characters, and stops once one script has more than SCRIPT_DOMINANT_CHARS
+# characters and no other Indic script has appeared
+SCRIPT_SCAN_CHUNK = 64
+SCRIPT_DOMINANT_CHARS = 32
+
+# Successful translations kept in memory, keyed by source language + cleaned text
+TRANSLATION_CACHE_SIZE = 4096
+
+def _detect_cache_key(text: str) -> str:
+    if len(text) < DETECT_CACHE_KEY_CHARS:
+        return text
+    return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).hexdigest()
+
+
+# Unicode blocks per script (each is 128 code points, i.e. one ord(c) >> 7 bucket)
+SCRIPT_BLOCKS = {
+    'Devanagari': 0x0900,  # Hindi, Marathi
+    'Kannada': 0x0C80,
+    'Tamil': 0x0B80,
+    'Telugu': 0x0C00,
+    'Bengali': 0x0980,
+    'Gujarati': 0x0A80,
+    'Malayalam': 0x0D00,
+    'Odia': 0x0B00,
+    'Gurmukhi': 0x0A00,  # Punjabi
 }
 
+# Script id per 128-code-point bucket; 0 means "not an Indic script"
+_SCRIPT_NAMES = [None] + list(SCRIPT_BLOCKS)
+_SCRIPT_LUT = bytearray(0x110000 >> 7)
+for _script_id, _block_start in enumerate(SCRIPT_BLOCKS.values(), start=1):
+    _SCRIPT_LUT[_block_start >> 7] = _script_id
+
 
 class MultilingualProcessor:
     """
@@ -70,25 +306,51 @@ class MultilingualProcessor:
         self._lang_detector = None
         self._translator_model = None
         self._translator_tokenizer = None
+        self._device = None
+        self._translator_lock = threading.Lock()
         self._transliterator = None
+        self._detector_is_fasttext = False
+        self._detect_cache: "OrderedDict[str, Tuple[str, str, str, float]]" = OrderedDict()
+        self._translation_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
         
     def _ensure_detector(self):
-        """Load language detector (lazy loading)."""
+        """Load language detector (lazy loading): fastText if configured, else langdetect."""
         if self._lang_detector is not None:
             return
+        
+        model_path = os.getenv("LANGID_MODEL_PATH")  # e.g. lid.176.ftz
+        if model_path and os.path.exists(model_path):
+            try:
+                import fasttext
+                self._lang_detector = fasttext.load_model(model_path)
+                self._detector_is_fasttext = True
+                logger.info(f"fastText language ID model loaded: {model_path}")
+                return
+            except Exception as e:
+                logger.warning(f"fastText unavailable, using langdetect: {str(e)[:100]}")
             
         try:
             import langdetect
+            _load_langdetect_profiles(langdetect)
             self._lang_detector = langdetect
             logger.info("Language detector loaded successfully")
         except Exception as e:
             logger.exception("Failed to load language detector: %s", e)
     
+    def prewarm(self) -> None:
+        """Load the translation model ahead of the first translation (blocking; run it off the event loop)."""
+        self._ensure_translator()
+    
     def _ensure_translator(self):
-        """Load IndicTrans2 translation model (lazy loading)."""
+        """Load IndicTrans2 translation model (lazy loading; safe to call from a prewarm thread)."""
         if self._translator_model is not None:
             return
-            
+        with self._translator_lock:
+            if self._translator_model is None:
+                self._load_translator()
+    
+    def _load_translator(self):
+        """Load IndicTrans2 onto the best available device (called once, under the lock)."""
         try:
             from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
             import torch
@@ -107,36 +369,77 @@ class MultilingualProcessor:
             
             device = "cuda" if torch.cuda.is_available() else "cpu"
             
+            # On CPU, ONNX Runtime's fused kernels beat eager PyTorch
+            if device == "cpu" and ONNXRUNTIME_AVAILABLE:
+                try:
+                    self._translator_model = self._load_onnx_translator(model_name, hf_token)
+                    self._device = torch.device(device)
+                    logger.info("IndicTrans2 loaded on cpu (ONNX Runtime)")
+                    return
+                except Exception as e:
+                    logger.warning(f"IndicTrans2 ONNX export failed: {str(e)[:100]}. Using the PyTorch model.")
+            
+            # Half precision on GPU halves weight traffic during decoding;
+            # bf16 where supported (Ampere+), fp16 otherwise, fp32 on CPU
+            if device == "cuda":
+                dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+            else:
+                dtype = torch.float32
+            
             self._translator_model = AutoModelForSeq2SeqLM.from_pretrained(
                 model_name,
                 token=hf_token,
-                trust_remote_code=True
+                trust_remote_code=True,
+                torch_dtype=dtype,
             ).to(device)
+            self._translator_model.eval()
+            self._device = torch.device(device)
             
-            logger.info(f"IndicTrans2 loaded on {device}")
+            logger.info(f"IndicTrans2 loaded on {device} ({dtype})")
             
         except Exception as e:
             logger.warning(f"IndicTrans2 unavailable: {str(e)[:100]}")
             self._translator_model = False
             self._translator_tokenizer = False
     
+    @staticmethod
+    def _load_onnx_translator(model_name: str, hf_token: Optional[str]):
+        """Export IndicTrans2 to ONNX once, then reuse the export from disk"""
+        onnx_dir = os.path.join(settings.MODEL_CACHE_DIR or "./models", "indictrans2_onnx")
+        
+        if not os.path.exists(os.path.join(onnx_dir, "config.json")):
+            exported = ORTModelForSeq2SeqLM.from_pretrained(
+                model_name, export=True, token=hf_token, trust_remote_code=True
+            )
+            exported.save_pretrained(onnx_dir)
+            del exported
+        
+        # Load from disk on the first run too, so every run gets the same provider
+        return ORTModelForSeq2SeqLM.from_pretrained(onnx_dir, provider="CPUExecutionProvider")
+    
     def _detect_script(self, text: str) -> Optional[str]:
         """Detect writing script based on Unicode ranges."""
         if not text:
             return None
             
-        # Count characters per script
-        script_counts: Dict[str, int] = {}
-        for script, chars in SCRIPT_PATTERNS.items():
-            count = sum(1 for c in text if c in chars)
-            if count > 0:
-                script_counts[script] = count
+        # Count characters per script with one table lookup per character,
+        # stopping once a single Indic script clearly dominates
+        counts = [0] * len(_SCRIPT_NAMES)
+        lut = _SCRIPT_LUT
+        for start in range(0, len(text), SCRIPT_SCAN_CHUNK):
+            for c in text[start:start + SCRIPT_SCAN_CHUNK]:
+                counts[lut[ord(c) >> 7]] += 1
+            top = max(counts[1:])
+            if top > SCRIPT_DOMINANT_CHARS and top == sum(counts[1:]):
+                break
+        counts[0] = 0
         
-        if not script_counts:
+        best = max(range(len(counts)), key=counts.__getitem__)
+        if not counts[best]:
             return "Latin"  # Default to Latin/English
         
         # Return script with maximum count
-        return max(script_counts.items(), key=lambda x: x[1])[0]
+        return _SCRIPT_NAMES[best]
     
     def detect_language(self, text: str) -> Dict[str, Any]:
         """
@@ -160,50 +463,85 @@ class MultilingualProcessor:
                 'confidence': 0.0
             }
         
+        return self._detect_cached(text)
+    
+    def detect_language_many(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """
+        detect_language for a list of texts, in input order. With a fastText
+        model, every text not already cached is scored in a single predict()
+        call; otherwise texts are detected one by one.
+        """
+        self._ensure_detector()
+        predictions: Dict[str, Tuple[str, Optional[float]]] = {}
+        if self._detector_is_fasttext:
+            todo = list(dict.fromkeys(
+                text for text in texts
+                if text and len(text.strip()) >= 3 and _detect_cache_key(text) not in self._detect_cache
+            ))
+            if todo:
+                try:
+                    labels, probs = self._lang_detector.predict([t.replace('\n', ' ') for t in todo], k=1)
+                    for text, label, prob in zip(todo, labels, probs):
+                        predictions[text] = (label[0].replace('__label__', ''), round(float(prob[0]), 4))
+                except Exception as e:
+                    logger.debug(f"fastText batch prediction failed, detecting one by one: {e}")
+        
+        return [
+            self._detect_cached(text, predictions[text]) if text in predictions else self.detect_language(text)
+            for text in texts
+        ]
+    
+    def _detect_cached(self, text: str, prediction: Optional[Tuple[str, Optional[float]]] = None) -> Dict[str, Any]:
+        """Cache lookup around _detect_language_uncached (headlines and boilerplate recur across feeds)"""
+        key = _detect_cache_key(text)
+        cached = self._detect_cache.get(key)
+        if cached is not None:
+            self._detect_cache.move_to_end(key)
+        else:
+            cached = self._detect_language_uncached(text, prediction)
+            self._detect_cache[key] = cached
+            if len(self._detect_cache) > DETECT_CACHE_SIZE:
+                self._detect_cache.popitem(last=False)
+        
+        code, name, script, confidence = cached
+        return {
+            'code': code,
+            'name': name,
+            'script': script,
+            'confidence': confidence
+        }
+    
+    def _detect_language_uncached(
+        self, text: str, prediction: Optional[Tuple[str, Optional[float]]] = None
+    ) -> Tuple[str, str, str, float]:
+        """
+        detect_language without the cache; returns (code, name, script, confidence).
+        `prediction` is a precomputed _predict_language result (batched fastText).
+        """
         # Script-based detection (most reliable for Indian languages)
         script = self._detect_script(text)
         
         # Map script to primary language
-        script_to_lang = {
-            'Devanagari': None,  # Ambiguous - could be Hindi or Marathi, use langdetect
-            'Kannada': 'kn',
-            'Tamil': 'ta',
-            'Telugu': 'te',
-            'Bengali': 'bn',
-            'Gujarati': 'gu',
-            'Malayalam': 'ml',
-            'Odia': 'or',
-            'Gurmukhi': 'pa',
-            'Latin': 'en',
-        }
-        
-        lang_code = script_to_lang.get(script, 'unknown')
+        lang_code = SCRIPT_TO_LANG.get(script, 'unknown')
         confidence = 0.9 if lang_code and lang_code != 'unknown' else 0.5  # Lower confidence for Devanagari
         
-        # Try langdetect as secondary method (REQUIRED for Devanagari to distinguish Hindi/Marathi)
+        # Try the statistical detector as secondary method (REQUIRED for Devanagari to distinguish Hindi/Marathi)
         self._ensure_detector()
         if self._lang_detector:
             try:
-                from langdetect import detect, detect_langs
-                detected = detect(text)
-                # Map langdetect codes to our codes
-                langdetect_map = {
-                    'hi': 'hi', 'kn': 'kn', 'ta': 'ta', 'te': 'te',
-                    'bn': 'bn', 'gu': 'gu', 'mr': 'mr', 'pa': 'pa',
-                    'ml': 'ml', 'or': 'or', 'ur': 'ur', 'en': 'en',
-                }
-                if detected in langdetect_map:
+                detected, probability = prediction or self._predict_language(text)
+                if detected in LANGDETECT_MAP:
                     # For Devanagari script, always use langdetect (to distinguish Hindi/Marathi)
                     if script == 'Devanagari':
-                        lang_code = langdetect_map[detected]
-                        confidence = 0.90
+                        lang_code = LANGDETECT_MAP[detected]
+                        confidence = probability or 0.90
                     # If script-based and langdetect agree, increase confidence
-                    elif lang_code == langdetect_map[detected]:
-                        confidence = 0.95
+                    elif lang_code == LANGDETECT_MAP[detected]:
+                        confidence = max(probability or 0.95, confidence)
                     # Use langdetect result if script was ambiguous
                     elif lang_code is None or lang_code == 'unknown':
-                        lang_code = langdetect_map[detected]
-                        confidence = 0.75
+                        lang_code = LANGDETECT_MAP[detected]
+                        confidence = probability or 0.75
             except Exception:
                 # Fallback for Devanagari if langdetect fails - assume Hindi (most common)
                 if script == 'Devanagari' and not lang_code:
@@ -211,12 +549,31 @@ class MultilingualProcessor:
                     confidence = 0.60
                 logger.debug("langdetect failed, using script-based detection")
         
-        return {
-            'code': lang_code,
-            'name': INDIAN_LANGUAGES.get(lang_code, 'Unknown'),
-            'script': script or 'Unknown',
-            'confidence': confidence
-        }
+        return (
+            lang_code,
+            INDIAN_LANGUAGES.get(lang_code, 'Unknown'),
+            script or 'Unknown',
+            confidence,
+        )
+    
+    def _predict_language(self, text: str) -> Tuple[str, Optional[float]]:
+        """Top language code from the loaded detector, with its probability (fastText only)"""
+        if self._detector_is_fasttext:
+            labels, probs = self._lang_detector.predict(text.replace('\n', ' '), k=1)
+            return labels[0].replace('__label__', ''), round(float(probs[0]), 4)
+        from langdetect import detect
+        return detect(text), None
+    
+    def _generate_translations(self, texts: List[str]) -> List[str]:
+        """Run IndicTrans2 on a list of cleaned texts as one padded batch"""
+        import torch
+        inputs = self._translator_tokenizer(texts, return_tensors="pt", padding=True, truncation=True, max_length=512)
+        if self._device.type == "cuda":
+            # Pinned host memory lets the copy run asynchronously
+            inputs = {k: v.pin_memory().to(self._device, non_blocking=True) for k, v in inputs.items()}
+        with torch.inference_mode():
+            outputs = self._translator_model.generate(**inputs, max_length=512, num_beams=1)
+        return self._translator_tokenizer.batch_decode(outputs, skip_special_tokens=True)
     
     def translate_to_english(self, text: str, source_lang: str) -> Optional[str]:
         """Translate to English with MANDATORY fallback chain (IndicTrans2 -> deep_translator -> googletrans)"""
@@ -229,61 +586,130 @@ class MultilingualProcessor:
             return None
         
         # Truncate very long text
-        if len(text) > 5000:
-            text = text[:5000]
+        if len(text) > MAX_TRANSLATION_CHARS:
+            text = text[:MAX_TRANSLATION_CHARS]
         
+        # Feeds repeat entries between polls; reuse earlier translations
+        cached = self._cached_translation(text, source_lang)
+        if cached is not None:
+            return cached
+        
+        translated = None
         # Try IndicTrans2 first (best for Indian languages)
         self._ensure_translator()
-        if self._translator_model and self._translator_model is not False:
+        if self._translator_model and self._translator_model is not False and not _cooling_down("indictrans2"):
             try:
-                import torch
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-                inputs = self._translator_tokenizer(text, return_tensors="pt", padding=True, truncation=True, max_length=512).to(device)
-                outputs = self._translator_model.generate(**inputs, max_length=512)
-                translated = self._translator_tokenizer.decode(outputs[0], skip_special_tokens=True)
-                if translated and translated.strip() and len(translated.strip()) > 10:
+                output = self._generate_translations([text])[0]
+                if output and output.strip() and len(output.strip()) > 10:
                     logger.info(f"✓ IndicTrans2 translation successful for {source_lang}")
-                    return translated.strip()
+                    translated = output.strip()
             except Exception as e:
                 logger.warning(f"IndicTrans2 failed for {source_lang}: {str(e)[:100]}")
+                _trip("indictrans2")
         
-        # MANDATORY Fallback 1: deep_translator (Google Translate API)
-        try:
-            from deep_translator import GoogleTranslator
-            translator = GoogleTranslator(source=source_lang, target='en')
-            result = translator.translate(text)
-            if result and len(result.strip()) > 10:
-                logger.info(f"✓ deep_translator (Google) fallback successful for {source_lang}")
-                return result.strip()
-        except ImportError:
-            logger.debug("deep_translator not installed, trying googletrans...")
-        except Exception as e:
-            logger.warning(f"deep_translator failed for {source_lang}: {str(e)[:100]}")
+        if translated is None:
+            translated = self._translate_fallback(text, source_lang)
+        self._remember_translation(text, source_lang, translated)
+        return translated
+    
+    def translate_batch(self, texts: List[str], source_lang: str) -> List[Optional[str]]:
+        """
+        Translate several texts of one language to English.
+        IndicTrans2 runs once per TRANSLATION_BATCH_SIZE texts, shortest first so
+        each batch pads to a similar length; texts it cannot translate go through
+        the same fallback chain as translate_to_english. Results keep input order.
+        """
+        if source_lang == 'en':
+            return list(texts)
         
-        # MANDATORY Fallback 2: googletrans library
-        try:
-            from googletrans import Translator
-            translator = Translator()
-            result = translator.translate(text, src=source_lang, dest='en')
-            if result and result.text and len(result.text.strip()) > 10:
-                logger.info(f"✓ googletrans fallback successful for {source_lang}")
-                return result.text.strip()
-        except Exception as e:
-            logger.warning(f"googletrans failed for {source_lang}: {str(e)[:100]}")
+        results: List[Optional[str]] = [text if not text else None for text in texts]
+        cleaned: Dict[int, str] = {}
+        for i, text in enumerate(texts):
+            if text:
+                text = clean_html(text)
+                if text:
+                    text = text[:MAX_TRANSLATION_CHARS]
+                    cached = self._cached_translation(text, source_lang)
+                    if cached is not None:
+                        results[i] = cached
+                    else:
+                        cleaned[i] = text
         
-        # MANDATORY Fallback 3: MyMemory Translation API (free, no auth required)
-        try:
-            import requests
-            url = f"https://api.mymemory.translated.net/get?q={text[:500]}&langpair={source_lang}|en"
-            response = requests.get(url, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                translated = data.get('responseData', {}).get('translatedText', '')
-                if translated and len(translated.strip()) > 10:
-                    logger.info(f"✓ MyMemory API fallback successful for {source_lang}")
-                    return translated.strip()
-        except Exception as e:
-            logger.warning(f"MyMemory API failed for {source_lang}: {str(e)[:100]}")
+        if cleaned:
+            self._ensure_translator()
+        if cleaned and self._translator_model and self._translator_model is not False and not _cooling_down("indictrans2"):
+            order = sorted(cleaned, key=lambda i: len(cleaned[i]))
+            for start in range(0, len(order), TRANSLATION_BATCH_SIZE):
+                chunk = order[start:start + TRANSLATION_BATCH_SIZE]
+                try:
+                    translated = self._generate_translations([cleaned[i] for i in chunk])
+                except Exception as e:
+                    logger.warning(f"IndicTrans2 batch failed for {source_lang}: {str(e)[:100]}")
+                    _trip("indictrans2")
+                    break
+                for i, text in zip(chunk, translated):
+                    if text and len(text.strip()) > 10:
+                        results[i] = text.strip()
+            logger.info(f"✓ IndicTrans2 translated {sum(results[i] is not None for i in cleaned)}/{len(cleaned)} texts for {source_lang}")
+        
+        for i, text in cleaned.items():
+            if results[i] is None:
+                results[i] = self._translate_fallback(text, source_lang)
+            self._remember_translation(text, source_lang, results[i])
+        return results
+    
+    def translate_article(self, title: str, summary: str, source_lang: str) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Translate an article's title and summary in one translate_batch call.
+        Returns (text for NLP, title_en, summary_en). Each field stands on its own:
+        a field that could not be translated is None and its original text is used
+        in the NLP text, which is None only when nothing was translated.
+        """
+        title_en, summary_en = self.translate_batch([title, summary], source_lang)
+        if not (title_en or summary_en):
+            return None, title_en, summary_en
+        text = f"{title if title_en is None else title_en}\n\n{summary if summary_en is None else summary_en}"
+        return text, title_en, summary_en
+    
+    def _cached_translation(self, text: str, source_lang: str) -> Optional[str]:
+        key = (source_lang, _detect_cache_key(text))
+        cached = self._translation_cache.get(key)
+        if cached is not None:
+            self._translation_cache.move_to_end(key)
+        return cached
+    
+    def _remember_translation(self, text: str, source_lang: str, translated: Optional[str]) -> None:
+        # Failures are not cached so the next poll retries them
+        if not translated:
+            return
+        self._translation_cache[(source_lang, _detect_cache_key(text))] = translated
+        if len(self._translation_cache) > TRANSLATION_CACHE_SIZE:
+            self._translation_cache.popitem(last=False)
+    
+    def _translate_fallback(self, text: str, source_lang: str) -> Optional[str]:
+        """
+        Online fallback chain for cleaned text IndicTrans2 could not translate.
+        Providers are tried in order, but hedged: if one has neither answered nor
+        failed within FALLBACK_HEDGE_SECONDS the next one is started alongside it,
+        and the first valid translation wins. A slow provider no longer adds its
+        full timeout before the next is tried, and a quick success costs one call.
+        """
+        providers = [
+            provider for name, provider in _FALLBACK_PROVIDERS if not _cooling_down(name)
+        ]
+        pending = set()
+        while providers or pending:
+            if providers:
+                pending.add(_fallback_executor().submit(providers.pop(0), text, source_lang))
+            done, pending = wait(
+                pending,
+                timeout=FALLBACK_HEDGE_SECONDS if providers else None,
+                return_when=FIRST_COMPLETED,
+            )
+            for future in done:
+                result = future.result()
+                if result:
+                    return result
         
         # If ALL translation methods fail, log error and return None
         logger.error(f"✗ ALL translation methods failed for {source_lang}. Article will have no English translation.")
@@ -341,3 +767,13 @@ class MultilingualProcessor:
     def get_supported_languages(self) -> Dict[str, str]:
         """Return dictionary of supported language codes and names."""
         return INDIAN_LANGUAGES.copy()
+
+
+_shared_processor: Optional[MultilingualProcessor] = None
+
+def get_language_processor() -> MultilingualProcessor:
+    """Process-wide MultilingualProcessor, so models are loaded (and prewarmed) once"""
+    global _shared_processor
+    if _shared_processor is None:
+        _shared_processor = MultilingualProcessor()
+    return _shared_processor
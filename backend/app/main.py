@@ -4,13 +4,13 @@ import logging
 import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from starlette.responses import FileResponse
 from pathlib import Path
 
 from .config import settings
 from .database import get_database
 from .news_collector import NewsCollector
+from .static_files import CachedStaticFiles
 
 # Setup logging first
 logging.basicConfig(level=getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO))
@@ -61,6 +61,7 @@ async def on_startup():
                 collector.collect_once()
             except Exception:
                 logging.exception("Periodic collect failed")
+            db_local.refresh_geo_rollup()
             await asyncio.sleep(interval)
     
     # Pre-build RAG vector store in background (non-blocking)
@@ -78,8 +79,22 @@ async def on_startup():
         except Exception as e:
             logger.warning(f"Could not pre-build RAG vector store: {e}")
 
+    # Load the translation model off the request path, before articles need it
+    async def prewarm_translator():
+        await asyncio.sleep(1)
+        from .language_processor import get_language_processor
+        processor = get_language_processor()
+        app.state.language_processor = processor
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, processor.prewarm)
+            logger.info("Translation model prewarmed")
+        except Exception as e:
+            logger.warning(f"Could not prewarm translation model: {e}")
+
     # Enable background tasks
     try:
+        if settings.TRANSLATION_ENABLED:
+            asyncio.create_task(prewarm_translator())
         asyncio.create_task(periodic_collect())
         asyncio.create_task(build_rag_vectorstore())
         logger.info("Background collector scheduled")
@@ -153,7 +168,7 @@ try:
 
     if dist_dir.exists():
         # Mount static files at root; API is already mounted above and takes precedence
-        app.mount("/", StaticFiles(directory=dist_dir, html=True), name="static")
+        app.mount("/", CachedStaticFiles(directory=dist_dir, html=True), name="static")
         logger.info(f"Mounted frontend static files from: {dist_dir}")
     else:
         logger.info(f"Frontend 'dist' not found at {dist_dir}; skipping static mount")
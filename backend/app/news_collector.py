@@ -1,17 +1,27 @@
 from __future__ import annotations
+import hashlib
+import json
 import logging
+import re
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 from pathlib import Path
 
 import feedparser  # type: ignore
+import requests
+from requests.adapters import HTTPAdapter
 import yaml  # type: ignore
 from dateutil import parser as dtparser  # type: ignore
 
 from .config import settings
 from .database import Database
 from .nlp_model import NLPModel
-from .language_processor import MultilingualProcessor
+from .language_processor import get_language_processor
 from .utils import compute_article_hash, normalize_sentiment
 from .goi_filter import stage2_keyword_filter, classify_goi_relevance
 from .content_classifier import classify_content
@@ -24,20 +34,154 @@ except ImportError:
     def classify_article_region(article_dict):
         return None
 
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# pyahocorasick is optional; without it link filtering uses a regex alternation
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Enable web scraping for regional languages
 ENABLE_WEB_SCRAPING = False
 REGIONAL_LANGUAGES = ['kn', 'ta', 'te', 'bn', 'ml', 'mr', 'gu', 'pa', 'or', 'ur', 'as']
 
+# RSS feeds are downloaded concurrently, then parsed one by one on the calling thread
+FEED_FETCH_WORKERS = 8
+FEED_FETCH_TIMEOUT = 20
+
+# Candidate article pages downloaded concurrently per scraping source
+ARTICLE_FETCH_WORKERS = 5
+# Relevance/content classification results kept per distinct (text, title, language, entities)
+CLASSIFY_CACHE_SIZE = 10000
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+# Scraped links containing any of these (lowercased) are not articles
+SKIP_LINK_PATTERNS = ['login', 'signup', 'subscribe', 'advertise', 'about',
+                      'contact', 'terms', 'privacy', 'category', 'tag',
+                      'author', 'search', '#', 'javascript:', 'mailto:']
+# Links containing any of these are preferred as article URLs
+ARTICLE_LINK_PATTERNS = ['/news/', '/article/', '/story/', '/india/', '/national/',
+                         '/politics/', '/government/', '202', '2025']
+
+
+def _substring_matcher(patterns: List[str]) -> Callable[[str], bool]:
+    """True if the text contains any of the patterns, in a single pass over the text"""
+    if AHOCORASICK_AVAILABLE:
+        automaton = ahocorasick.Automaton()
+        for pattern in patterns:
+            automaton.add_word(pattern, pattern)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+    regex = re.compile("|".join(map(re.escape, patterns)))
+    return lambda text: regex.search(text) is not None
+
+
+_is_skip_link = _substring_matcher(SKIP_LINK_PATTERNS)
+_is_article_link = _substring_matcher(ARTICLE_LINK_PATTERNS)
+
+
+def _extract_hrefs(html: bytes) -> List[str]:
+    """href of every <a> on a page: one lxml XPath query, BeautifulSoup if lxml is missing or fails"""
+    if LXML_AVAILABLE:
+        try:
+            # str() detaches the results from the parsed tree
+            return [str(href) for href in lxml.html.fromstring(html).xpath('//a[@href]/@href')]
+        except Exception as e:
+            logger.debug("lxml could not parse page, using BeautifulSoup: %s", e)
+    from bs4 import BeautifulSoup
+    soup = BeautifulSoup(html, 'html.parser')
+    return [a_tag.get('href', '') for a_tag in soup.find_all('a', href=True)]
+
+
+# RSS 2.0 <item> children -> the feedparser entry keys _entry_to_article reads
+_RSS_ITEM_FIELDS = {
+    "link": "link",
+    "guid": "id",
+    "title": "title",
+    "description": "summary",
+    "pubDate": "published",
+    "{http://purl.org/dc/elements/1.1/}date": "updated",
+}
+
+
+def _fast_parse_rss(raw: bytes) -> List[Dict[str, Any]]:
+    """
+    Streaming parse of plain RSS 2.0 <item>s with lxml, keeping only the fields
+    the collector uses. Raises on malformed XML and returns [] for documents
+    without un-namespaced <item>s (Atom, RSS 1.0), so callers fall back to feedparser.
+    """
+    entries: List[Dict[str, Any]] = []
+    for _, item in etree.iterparse(BytesIO(raw), events=("end",), tag="item", resolve_entities=False):
+        entry: Dict[str, Any] = {}
+        for child in item:
+            key = _RSS_ITEM_FIELDS.get(child.tag)
+            if key and key not in entry:
+                value = "".join(child.itertext()).strip()
+                if value:
+                    entry[key] = value
+        entries.append(entry)
+        # Drop parsed items so memory stays bounded on large feeds
+        item.clear()
+        while item.getprevious() is not None:
+            del item.getparent()[0]
+    return entries
+
+
+# RFC 822 zones that email.utils and dateutil both read as UTC; other names
+# (IST, EST, ...) and "-0000" are parsed differently, so they go to dateutil
+_RFC822_UTC_ZONES = ("GMT", "UTC", "Z")
+
+
+@lru_cache(maxsize=2048)
+def _parse_date_string(value: str) -> datetime:
+    """
+    Feed dates are almost always RFC 822 (RSS) or ISO 8601 (Atom); try the stdlib
+    parsers for those before dateutil's general heuristics. The fast paths only
+    accept input they parse exactly like dateutil (published_at feeds the article hash).
+    """
+    value = value.strip()
+    zone = value.rsplit(None, 1)[-1]
+    if zone in _RFC822_UTC_ZONES or (
+        len(zone) == 5 and zone[0] in "+-" and zone[1:].isdigit() and zone != "-0000"
+    ):
+        try:
+            return parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            pass
+    try:
+        return datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except ValueError:
+        pass
+    return dtparser.parse(value)
+
 
 class NewsCollector:
     def __init__(self, db: Database, nlp: Optional[NLPModel] = None):
         self.db = db
         self.nlp = nlp or NLPModel()
-        self.lang_processor = MultilingualProcessor()
+        self.lang_processor = get_language_processor()
         self.feeds = self._load_feeds(settings.FEEDS_FILE)
         self.scraping_sources = self._load_scraping_sources() if ENABLE_WEB_SCRAPING else []
+        self._http = self._make_session()
+        self._classify_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def _make_session() -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({"User-Agent": USER_AGENT})
+        return session
 
     def _load_feeds(self, path: str) -> List[Dict[str, Any]]:
         try:
@@ -60,12 +204,44 @@ class NewsCollector:
             logger.warning("Scraping sources file not found")
             return []
     
+    def _memoized(self, kind: str, parts: List[str], compute: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Content-hash cache for the deterministic classifiers (feeds repeat entries between polls)"""
+        h = hashlib.blake2b(kind.encode(), digest_size=16)
+        for part in parts:
+            h.update(b"\0")
+            h.update(part.encode("utf-8", "surrogatepass"))
+        key = h.digest()
+        cached = self._classify_cache.get(key)
+        if cached is not None:
+            self._classify_cache.move_to_end(key)
+            return cached
+        result = compute()
+        self._classify_cache[key] = result
+        if len(self._classify_cache) > CLASSIFY_CACHE_SIZE:
+            self._classify_cache.popitem(last=False)
+        return result
+
+    def _fetch_feed(self, url: str) -> Optional[bytes]:
+        """Download raw feed bytes; errors are logged so one bad feed doesn't stop the rest"""
+        try:
+            response = self._http.get(url, timeout=FEED_FETCH_TIMEOUT)
+            response.raise_for_status()
+            return response.content
+        except Exception as e:
+            logger.warning("Failed fetching feed %s: %s", url, e)
+            return None
+
+    def _download_html(self, url: str, timeout: int, headers: Dict[str, str]):
+        """Fetch an article page through the shared session (instead of newspaper's own requests call)"""
+        page = self._http.get(url, timeout=timeout, headers=headers)
+        page.raise_for_status()
+        # Like newspaper's get_html: raw bytes when requests only guessed ISO-8859-1
+        return page.content if page.encoding == 'ISO-8859-1' else page.text
+
     def _scrape_article(self, source: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Scrape articles from a web source using newspaper3k with improved extraction"""
         try:
             from newspaper import Article, Config
-            import requests
-            from bs4 import BeautifulSoup
             from urllib.parse import urljoin, urlparse
             
             url = source.get("url")
@@ -74,28 +250,26 @@ class NewsCollector:
             
             # Enhanced config for better scraping
             config = Config()
-            config.browser_user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            config.browser_user_agent = USER_AGENT
             config.request_timeout = 15
             config.fetch_images = False
             config.memoize_articles = False
             
-            # Get article links from the page
+            # Get article links from the page (shared session: pages and articles reuse connections)
             headers = {
-                'User-Agent': config.browser_user_agent,
                 'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
                 'Accept-Language': 'en-US,en;q=0.5',
             }
             
-            response = requests.get(url, timeout=15, headers=headers)
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self._http.get(url, timeout=config.request_timeout, headers=headers)
             
             # Find article links - more intelligent filtering
-            all_links = soup.find_all('a', href=True)
+            all_links = _extract_hrefs(response.content)
             article_links = []
+            seen = set()  # membership for article_links, which keeps page order
             base_domain = urlparse(url).netloc
             
-            for a_tag in all_links:
-                link = a_tag.get('href', '')
+            for link in all_links:
                 if not link:
                     continue
                     
@@ -104,6 +278,8 @@ class NewsCollector:
                     link = urljoin(url, link)
                 elif not link.startswith('http'):
                     continue
+                if link in seen:
+                    continue
                 
                 # Filter: Must be from same domain and look like article URL
                 link_domain = urlparse(link).netloc
@@ -111,55 +287,60 @@ class NewsCollector:
                     continue
                 
                 # Skip common non-article pages
-                skip_patterns = ['login', 'signup', 'subscribe', 'advertise', 'about', 
-                                'contact', 'terms', 'privacy', 'category', 'tag', 
-                                'author', 'search', '#', 'javascript:', 'mailto:']
-                if any(pattern in link.lower() for pattern in skip_patterns):
+                if _is_skip_link(link.lower()):
                     continue
                 
                 # Prefer URLs that look like article URLs
-                if any(pattern in link for pattern in ['/news/', '/article/', '/story/', '/india/', '/national/', 
-                                                        '/politics/', '/government/', '202', '2025']):
-                    if link not in article_links:
-                        article_links.append(link)
-                elif link not in article_links and len(article_links) < 30:
+                if _is_article_link(link) or len(article_links) < 30:
+                    seen.add(link)
                     article_links.append(link)
             
             logger.debug(f"Found {len(article_links)} potential article links from {source_name}")
             
             articles = []
-            # Try up to 10 articles to find at least 3 valid ones
-            for article_url in article_links[:10]:
-                if len(articles) >= 3:  # Stop after finding 3 valid articles
-                    break
-                    
-                try:
-                    article = Article(article_url, config=config, language=language)
-                    article.download()
-                    article.parse()
-                    
-                    # More lenient validation - accept if we have either good title OR good content
-                    has_title = article.title and len(article.title.strip()) > 10
-                    has_content = article.text and len(article.text.strip()) > 100
-                    
-                    if has_title and has_content:
-                        articles.append({
-                            'url': article_url,
-                            'title': article.title.strip(),
-                            'summary': article.text[:500].strip(),
-                            'content': article.text.strip(),
-                            'source': source_name,
-                            'language': language,
-                            'region': source.get('region'),
-                            'published_at': article.publish_date or datetime.utcnow()
-                        })
-                        logger.debug(f"Successfully extracted article: {article.title[:50]}...")
-                    else:
-                        logger.debug(f"Skipping article with insufficient content: title_len={len(article.title) if article.title else 0}, content_len={len(article.text) if article.text else 0}")
+            # Try up to 10 articles to find at least 3 valid ones. Downloads run
+            # concurrently; parsing stays on this thread, in link order.
+            candidates = article_links[:10]
+            pool = ThreadPoolExecutor(max_workers=ARTICLE_FETCH_WORKERS, thread_name_prefix="article-fetch")
+            try:
+                futures = [
+                    pool.submit(self._download_html, article_url, config.request_timeout, headers)
+                    for article_url in candidates
+                ]
+                for article_url, future in zip(candidates, futures):
+                    if len(articles) >= 3:  # Stop after finding 3 valid articles
+                        break
                         
-                except Exception as e:
-                    logger.debug(f"Failed to scrape {article_url}: {str(e)[:100]}")
-                    continue
+                    try:
+                        article = Article(article_url, config=config, language=language)
+                        article.download(input_html=future.result())
+                        article.parse()
+                        
+                        # More lenient validation - accept if we have either good title OR good content
+                        has_title = article.title and len(article.title.strip()) > 10
+                        has_content = article.text and len(article.text.strip()) > 100
+                        
+                        if has_title and has_content:
+                            articles.append({
+                                'url': article_url,
+                                'title': article.title.strip(),
+                                'summary': article.text[:500].strip(),
+                                'content': article.text.strip(),
+                                'source': source_name,
+                                'language': language,
+                                'region': source.get('region'),
+                                'published_at': article.publish_date or datetime.utcnow()
+                            })
+                            logger.debug(f"Successfully extracted article: {article.title[:50]}...")
+                        else:
+                            logger.debug(f"Skipping article with insufficient content: title_len={len(article.title) if article.title else 0}, content_len={len(article.text) if article.text else 0}")
+                        
+                    except Exception as e:
+                        logger.debug(f"Failed to scrape {article_url}: {str(e)[:100]}")
+                        continue
+            finally:
+                # Downloads not yet started are dropped once 3 articles are found
+                pool.shutdown(wait=False, cancel_futures=True)
             
             if articles:
                 logger.info(f"Successfully scraped {len(articles)} articles from {source_name}")
@@ -182,15 +363,34 @@ class NewsCollector:
             if not c:
                 continue
             try:
-                return dtparser.parse(c)
+                return _parse_date_string(c)
             except Exception:
                 continue
         return None
 
     def _entry_to_article(self, feed_meta: Dict[str, Any], entry: Dict[str, Any]) -> Dict[str, Any]:
+        partial = self._entry_to_article_prenlp(feed_meta, entry)
+        analysis = None
+        if settings.NLP_ENABLED and self.nlp and partial["prelim_goi"]:
+            analysis = self.nlp.analyze(partial["text_for_nlp"], language=partial["nlp_language"])
+        return self._entry_to_article_postnlp(partial, analysis)
+
+    @staticmethod
+    def _entry_title_summary(entry: Dict[str, Any]) -> Tuple[str, str]:
+        return entry.get("title") or "", entry.get("summary") or entry.get("description") or ""
+
+    def _entry_to_article_prenlp(
+        self,
+        feed_meta: Dict[str, Any],
+        entry: Dict[str, Any],
+        lang_result: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Language detection, translation and the stage 2 keyword filter (everything before NLP).
+        lang_result is detect_language() output for title + summary when the caller already has it.
+        """
         url = entry.get("link") or entry.get("id")
-        title = entry.get("title") or ""
-        summary = entry.get("summary") or entry.get("description") or ""
+        title, summary = self._entry_title_summary(entry)
         content = summary
         source = feed_meta.get("name")
         region = feed_meta.get("region")
@@ -207,7 +407,8 @@ class NewsCollector:
         is_regional_feed = language in ["mr", "ur", "as", "kn", "ta", "te", "bn", "ml", "gu", "pa", "or"]
         
         if full_text.strip():
-            lang_result = self.lang_processor.detect_language(full_text)
+            if lang_result is None:
+                lang_result = self.lang_processor.detect_language(full_text)
             detected_lang = lang_result.get("code")
             detected_script = lang_result.get("script")
             lang_confidence = lang_result.get("confidence")
@@ -230,12 +431,13 @@ class NewsCollector:
         if language and language != "en" and settings.TRANSLATION_ENABLED:
             # Translate to English for NLP processing
             logger.debug("Translating %s content to English for NLP", language)
-            translated_text = self.lang_processor.translate_to_english(full_text, language)
-            if translated_text:
-                text_for_nlp = translated_text
-                # Also translate title and summary separately for storage
-                translated_title = self.lang_processor.translate_to_english(title, language)
-                translated_summary = self.lang_processor.translate_to_english(summary, language)
+            # full_text is title + summary, so the NLP text is rebuilt from whichever
+            # of the two translations succeeded (original text for a failed field)
+            text_en, translated_title, translated_summary = self.lang_processor.translate_article(
+                title, summary, language
+            )
+            if text_en:
+                text_for_nlp = text_en
                 logger.info("Successfully translated %s article: %s", language, title[:50])
             else:
                 # If translation fails, NLP will work on original text (multilingual models)
@@ -244,16 +446,48 @@ class NewsCollector:
         # Stage 2: quick GoI keyword pre-filter on original text (title+summary)
         prelim_goi = stage2_keyword_filter(full_text, detected_lang or language)
 
+        return {
+            "url": url,
+            "title": title,
+            "summary": summary,
+            "content": content,
+            "source": source,
+            "region": region,
+            "language": language,
+            "detected_lang": detected_lang,
+            "detected_script": detected_script,
+            "lang_confidence": lang_confidence,
+            "translated_title": translated_title,
+            "translated_summary": translated_summary,
+            "published_at": published_at,
+            "full_text": full_text,
+            "text_for_nlp": text_for_nlp,
+            # Use detected language for NLP (MuRIL will be used for Indian languages)
+            "nlp_language": detected_lang or language,
+            "prelim_goi": prelim_goi,
+        }
+
+    def _entry_to_article_postnlp(self, partial: Dict[str, Any], analysis: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Relevance, scheme/geo/content classification and confidence scoring on top of NLP output"""
+        url = partial["url"]
+        title = partial["title"]
+        summary = partial["summary"]
+        content = partial["content"]
+        source = partial["source"]
+        region = partial["region"]
+        language = partial["language"]
+        detected_lang = partial["detected_lang"]
+        published_at = partial["published_at"]
+        full_text = partial["full_text"]
+        text_for_nlp = partial["text_for_nlp"]
+
         # NLP analysis (on English text or translated text)
-        # Pass detected language for language-specific sentiment models
         sentiment_label = None
         sentiment_score = None
         sentiment_polarity = None  # -1 to +1 polarity scale
         topic_labels: List[str] = []
         entities: List[Dict[str, Any]] = []
-        if settings.NLP_ENABLED and self.nlp and prelim_goi:
-            # Use detected language for NLP (MuRIL will be used for Indian languages)
-            analysis = self.nlp.analyze(text_for_nlp, language=detected_lang or language)
+        if analysis:
             sentiment = analysis.get("sentiment") or {}
             if sentiment:
                 label, score = normalize_sentiment(sentiment)
@@ -265,7 +499,11 @@ class NewsCollector:
             entities = analysis.get("entities", []) or []
 
         # Stage 3: relevance scoring/classification (works with or without entities)
-        relevance = classify_goi_relevance(full_text, entities)
+        relevance = self._memoized(
+            "relevance",
+            [full_text, json.dumps(entities, sort_keys=True, default=str)],
+            lambda: classify_goi_relevance(full_text, entities),
+        )
         is_goi = relevance.get("is_goi", False)
         relevance_score = float(relevance.get("score", 0.0))
         goi_ministries = relevance.get("ministries") or []
@@ -298,7 +536,12 @@ class NewsCollector:
         # Content classification (Government/Political/Entertainment/etc.)
         # Use translated text if available for better accuracy
         text_for_classification = text_for_nlp if (language and language != "en" and text_for_nlp != full_text) else full_text
-        classification = classify_content(text_for_classification, title, detected_lang or language or "en")
+        classification_lang = detected_lang or language or "en"
+        classification = self._memoized(
+            "content",
+            [text_for_classification, title, classification_lang],
+            lambda: classify_content(text_for_classification, title, classification_lang),
+        )
         content_category = classification.get("primary_category")
         content_sub_category = classification.get("sub_category")
         classification_confidence = classification.get("confidence")
@@ -319,10 +562,10 @@ class NewsCollector:
             "region": region,  # Auto-detected or feed-declared
             "language": language,  # Detected or feed-declared language
             "detected_language": detected_lang,
-            "detected_script": detected_script,
-            "language_confidence": lang_confidence,
-            "translated_title": translated_title,
-            "translated_summary": translated_summary,
+            "detected_script": partial["detected_script"],
+            "language_confidence": partial["lang_confidence"],
+            "translated_title": partial["translated_title"],
+            "translated_summary": partial["translated_summary"],
             "published_at": published_at,
             "sentiment_label": sentiment_label,
             "sentiment_score": sentiment_score,
@@ -363,85 +606,172 @@ class NewsCollector:
         
         return article_dict
 
+    def _parse_feed(self, raw: bytes) -> List[Dict[str, Any]]:
+        """lxml fast path for plain RSS 2.0, feedparser for everything else (Atom, RDF, broken XML)"""
+        if LXML_AVAILABLE:
+            try:
+                entries = _fast_parse_rss(raw)
+                if entries:
+                    return entries
+            except Exception as e:
+                logger.debug("Fast RSS parse failed, using feedparser: %s", e)
+        return feedparser.parse(raw).get("entries", [])
+
+    def _entry_hash(self, entry: Dict[str, Any]) -> str:
+        """compute_article_hash from the raw entry (same fields _entry_to_article uses)"""
+        url = entry.get("link") or entry.get("id")
+        title = entry.get("title") or ""
+        return compute_article_hash(url, title, self._parse_date(entry))
+
+    def _stored_hashes(self, hashes: List[str]) -> Set[str]:
+        try:
+            return self.db.existing_hashes(hashes)
+        except Exception as e:
+            logger.warning("Could not look up stored article hashes: %s", e)
+            return set()
+
+    def _analyze_batched(self, partials: List[Dict[str, Any]]) -> List[Optional[Dict[str, Any]]]:
+        """Run NLP on the entries that passed the stage 2 filter, one analyze_batch call per language"""
+        analyses: List[Optional[Dict[str, Any]]] = [None] * len(partials)
+        if not (settings.NLP_ENABLED and self.nlp):
+            return analyses
+
+        # Grouping by language keeps each batch on a single sentiment model
+        by_language: Dict[Optional[str], List[int]] = {}
+        for i, partial in enumerate(partials):
+            if partial["prelim_goi"]:
+                by_language.setdefault(partial["nlp_language"], []).append(i)
+
+        for language, indices in by_language.items():
+            try:
+                results = self.nlp.analyze_batch(
+                    [partials[i]["text_for_nlp"] for i in indices],
+                    [language] * len(indices),
+                )
+            except Exception as e:
+                logger.exception("Batch NLP failed for language %s: %s", language, e)
+                continue
+            for i, analysis in zip(indices, results):
+                analyses[i] = analysis
+        return analyses
+
     def collect_once(self) -> Dict[str, int]:
         created = 0
         updated = 0
         
-        # Collect from RSS feeds
-        for feed in self.feeds:
-            url = feed.get("url")
-            if not url:
+        # Collect from RSS feeds (network fetches in parallel, parsing stays serial)
+        feeds = [feed for feed in self.feeds if feed.get("url")]
+        with ThreadPoolExecutor(max_workers=FEED_FETCH_WORKERS, thread_name_prefix="feed-fetch") as pool:
+            raw_feeds = list(pool.map(self._fetch_feed, [feed["url"] for feed in feeds]))
+
+        parsed_entries: List[Tuple[Dict[str, Any], Dict[str, Any], str]] = []
+        for feed, raw in zip(feeds, raw_feeds):
+            url = feed["url"]
+            if raw is None:
                 continue
             try:
-                parsed = feedparser.parse(url)
-                entries = parsed.get("entries", [])
+                entries = self._parse_feed(raw)
                 for e in entries:
-                    art = self._entry_to_article(feed, e)
-                    if not art.get("url"):
-                        continue
-                    
-                    # Determine if we should save the article - STRICT FILTERING (Government only)
-                    should_save = False
-                    feed_lang = feed.get("language", "en")
-                    
-                    # STRICT FILTERING: Only save Government category articles
-                    # Exception: PIB sources with schemes/ministries (official government source)
-                    
-                    is_gov_category = art.get("content_category") == "Government"
-                    should_show = art.get("should_show_pib") == True
-                    relevance_score = art.get("relevance_score", 0)
-                    is_pib_source = "pib" in feed.get("name", "").lower()
-                    has_schemes = len(art.get("goi_schemes", [])) > 0
-                    has_ministries = len(art.get("goi_ministries", [])) > 0
-                    confidence_score = art.get("confidence_score", 0)
-                    content_category = art.get("content_category", "")
-                    
-                    # PRIORITY 1: PIB sources with schemes/ministries - ALWAYS SAVE (trusted official source)
-                    if is_pib_source and (has_schemes or has_ministries):
+                    parsed_entries.append((feed, e, self._entry_hash(e)))
+            except Exception as e:
+                logger.exception("Failed collecting from %s: %s", url, e)
+
+        # Re-polled entries that are already stored skip all NLP work
+        stored = self._stored_hashes([h for _, _, h in parsed_entries])
+        skipped = 0
+
+        new_entries: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for feed, e, h in parsed_entries:
+            if h in stored:
+                skipped += 1
+                continue
+            new_entries.append((feed, e))
+
+        # Language detection for all new entries in one batched call, then
+        # translation and keyword pre-filter per entry
+        lang_results = self.lang_processor.detect_language_many(
+            ["\n\n".join(self._entry_title_summary(e)) for _, e in new_entries]
+        )
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any]]] = []
+        for (feed, e), lang_result in zip(new_entries, lang_results):
+            try:
+                pending.append((feed, self._entry_to_article_prenlp(feed, e, lang_result)))
+            except Exception as ex:
+                logger.exception("Failed collecting from %s: %s", feed["url"], ex)
+        if skipped:
+            logger.info("Skipped %d already stored feed entries", skipped)
+
+        # NLP for all entries of this cycle in per-language batches
+        analyses = self._analyze_batched([partial for _, partial in pending])
+
+        for (feed, partial), analysis in zip(pending, analyses):
+            try:
+                art = self._entry_to_article_postnlp(partial, analysis)
+                if not art.get("url"):
+                    continue
+                
+                # Determine if we should save the article - STRICT FILTERING (Government only)
+                should_save = False
+                feed_lang = feed.get("language", "en")
+                
+                # STRICT FILTERING: Only save Government category articles
+                # Exception: PIB sources with schemes/ministries (official government source)
+                
+                is_gov_category = art.get("content_category") == "Government"
+                should_show = art.get("should_show_pib") == True
+                relevance_score = art.get("relevance_score", 0)
+                is_pib_source = "pib" in feed.get("name", "").lower()
+                has_schemes = len(art.get("goi_schemes", [])) > 0
+                has_ministries = len(art.get("goi_ministries", [])) > 0
+                confidence_score = art.get("confidence_score", 0)
+                content_category = art.get("content_category", "")
+                
+                # PRIORITY 1: PIB sources with schemes/ministries - ALWAYS SAVE (trusted official source)
+                if is_pib_source and (has_schemes or has_ministries):
+                    should_save = True
+                    logger.info(f"✓ ACCEPTED-PIB ({feed_lang}): {art.get('title', '')[:60]} | Schemes: {has_schemes} | Ministries: {has_ministries}")
+                
+                # PRIORITY 2: Government category articles ONLY (strict filter)
+                elif is_gov_category and should_show:
+                    if (relevance_score >= 0.4 or confidence_score >= 0.7 or has_schemes or has_ministries):
                         should_save = True
-                        logger.info(f"✓ ACCEPTED-PIB ({feed_lang}): {art.get('title', '')[:60]} | Schemes: {has_schemes} | Ministries: {has_ministries}")
-                    
-                    # PRIORITY 2: Government category articles ONLY (strict filter)
-                    elif is_gov_category and should_show:
-                        if (relevance_score >= 0.4 or confidence_score >= 0.7 or has_schemes or has_ministries):
-                            should_save = True
-                            logger.info(f"✓ ACCEPTED-GOV ({feed_lang}): {art.get('title', '')[:60]} | Relevance: {relevance_score:.2f} | Conf: {confidence_score:.2f}")
-                        else:
-                            logger.debug(f"✗ REJECTED (weak signals): {art.get('title', '')[:60]}")
-                    
+                        logger.info(f"✓ ACCEPTED-GOV ({feed_lang}): {art.get('title', '')[:60]} | Relevance: {relevance_score:.2f} | Conf: {confidence_score:.2f}")
                     else:
-                        logger.debug(f"✗ REJECTED: {art.get('title', '')[:60]} (cat={content_category}, rel={relevance_score:.2f})")
+                        logger.debug(f"✗ REJECTED (weak signals): {art.get('title', '')[:60]}")
+                
+                else:
+                    logger.debug(f"✗ REJECTED: {art.get('title', '')[:60]} (cat={content_category}, rel={relevance_score:.2f})")
+                
+                if should_save:
+                    article_id, is_created = self.db.upsert_article(art)
+                    created += 1 if is_created else 0
+                    updated += 0 if is_created else 1
                     
-                    if should_save:
-                        article_obj, is_created = self.db.upsert_article(art)
-                        created += 1 if is_created else 0
-                        updated += 0 if is_created else 1
+                    # Check for negative sentiment and trigger PIB alert (Scheme-related ONLY)
+                    if settings.ALERT_ENABLED and is_created and article_id:
+                        sentiment_label = art.get("sentiment_label") or ""
+                        sentiment_label = sentiment_label.lower() if sentiment_label else ""
+                        sentiment_score = art.get("sentiment_score", 0.0)
+                        schemes = art.get("schemes", [])
                         
-                        # Check for negative sentiment and trigger PIB alert (Scheme-related ONLY)
-                        if settings.ALERT_ENABLED and is_created and article_obj:
-                            sentiment_label = art.get("sentiment_label") or ""
-                            sentiment_label = sentiment_label.lower() if sentiment_label else ""
-                            sentiment_score = art.get("sentiment_score", 0.0)
-                            schemes = art.get("schemes", [])
-                            
-                            # Only send alert if: negative sentiment AND schemes mentioned
-                            if schemes and sentiment_label == "negative" and sentiment_score >= settings.ALERT_NEGATIVE_THRESHOLD:
-                                try:
-                                    send_pib_alert(
-                                        article_title=art.get("title", ""),
-                                        article_summary=art.get("summary", ""),
-                                        article_link=art.get("url", ""),
-                                        language=art.get("language", "en"),
-                                        sentiment_score=sentiment_score,
-                                        article_id=str(article_obj.id),
-                                        schemes=schemes
-                                    )
-                                except Exception as alert_error:
-                                    logger.warning(f"Failed to send PIB alert: {alert_error}")
-                    else:
-                        logger.debug(f"Filtered out article: {art.get('title', '')[:50]}... (cat={art.get('content_category')}, relevance={art.get('relevance_score', 0):.2f})")
+                        # Only send alert if: negative sentiment AND schemes mentioned
+                        if schemes and sentiment_label == "negative" and sentiment_score >= settings.ALERT_NEGATIVE_THRESHOLD:
+                            try:
+                                send_pib_alert(
+                                    article_title=art.get("title", ""),
+                                    article_summary=art.get("summary", ""),
+                                    article_link=art.get("url", ""),
+                                    language=art.get("language", "en"),
+                                    sentiment_score=sentiment_score,
+                                    article_id=str(article_id),
+                                    schemes=schemes
+                                )
+                            except Exception as alert_error:
+                                logger.warning(f"Failed to send PIB alert: {alert_error}")
+                else:
+                    logger.debug(f"Filtered out article: {art.get('title', '')[:50]}... (cat={art.get('content_category')}, relevance={art.get('relevance_score', 0):.2f})")
             except Exception as e:
-                logger.exception("Failed collecting from %s: %s", url, e)
+                logger.exception("Failed collecting from %s: %s", feed.get("url"), e)
         
         # Collect from web scraping (regional languages only)
         if ENABLE_WEB_SCRAPING and self.scraping_sources:
@@ -474,12 +804,12 @@ class NewsCollector:
                                 should_save = True
                         
                         if should_save:
-                            article_obj, is_created = self.db.upsert_article(art)
+                            article_id, is_created = self.db.upsert_article(art)
                             created += 1 if is_created else 0
                             updated += 0 if is_created else 1
                             
                             # Check for negative sentiment and trigger PIB alert (Scheme-related ONLY)
-                            if settings.ALERT_ENABLED and is_created and article_obj:
+                            if settings.ALERT_ENABLED and is_created and article_id:
                                 sentiment_label = art.get("sentiment_label", "").lower()
                                 sentiment_score = art.get("sentiment_score", 0.0)
                                 schemes = art.get("schemes", [])
@@ -493,7 +823,7 @@ class NewsCollector:
                                             article_link=art.get("url", ""),
                                             language=art.get("language", "en"),
                                             sentiment_score=sentiment_score,
-                                            article_id=str(article_obj.id),
+                                            article_id=str(article_id),
                                             schemes=schemes
                                         )
                                     except Exception as alert_error:
@@ -503,7 +833,7 @@ class NewsCollector:
                 except Exception as e:
                     logger.error(f"Failed scraping {source.get('name')}: {e}")
         
-        return {"created": created, "updated": updated}
+        return {"created": created, "updated": updated, "skipped": skipped}
     
     def _process_scraped_article(self, raw_art: Dict[str, Any]) -> Dict[str, Any]:
         """Process scraped article through NLP pipeline"""
@@ -530,11 +860,14 @@ class NewsCollector:
         translated_summary = None
         
         if language != "en" and settings.TRANSLATION_ENABLED:
-            translated_text = self.lang_processor.translate_to_english(full_text, language)
-            if translated_text:
-                text_for_nlp = translated_text
-                translated_title = self.lang_processor.translate_to_english(title, language)
-                translated_summary = self.lang_processor.translate_to_english(summary, language)
+            # One batched translation call for title and summary
+            # full_text is title + summary, so the NLP text is rebuilt from whichever
+            # of the two translations succeeded (original text for a failed field)
+            text_en, translated_title, translated_summary = self.lang_processor.translate_article(
+                title, summary, language
+            )
+            if text_en:
+                text_for_nlp = text_en
         
         # GoI filter
         prelim_goi = stage2_keyword_filter(full_text, detected_lang or language)
@@ -10,6 +10,8 @@ from .cache import get_cache
 
 logger = logging.getLogger(__name__)
 
+INDIAN_LANGUAGES = ['hi', 'kn', 'ta', 'te', 'bn', 'gu', 'mr', 'pa', 'ml', 'or', 'ur', 'as']
+
 # Initialize cache
 nlp_cache = get_cache(redis_url=None)  # Set redis_url from env if available
 
@@ -237,6 +239,109 @@ class NLPModel:
             # Map neutral confidence to a small range around 0
             return 0.0
     
+    def _finalize_sentiment(self, text: str, raw_sentiment: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Apply the rule-based adjuster (if enabled) and attach polarity to a raw model output."""
+        if raw_sentiment and settings.RULE_BASED_ADJUSTER_ENABLED:
+            try:
+                adjuster = get_sentiment_adjuster(settings.SENTIMENT_BOOST_THRESHOLD)
+                adjustment_result = adjuster.adjust_sentiment(
+                    text,
+                    raw_sentiment.get('label', 'neutral').lower(),
+                    raw_sentiment.get('score', 0.5)
+                )
+                
+                # Convert to polarity scale [-1, +1]
+                adjusted_polarity = self._convert_to_polarity(
+                    adjustment_result['adjusted_label'],
+                    adjustment_result['adjusted_score']
+                )
+                original_polarity = self._convert_to_polarity(
+                    adjustment_result['original_label'],
+                    adjustment_result['original_score']
+                )
+                
+                # Adjusted sentiment including polarity
+                sentiment = {
+                    'label': adjustment_result['adjusted_label'],
+                    'score': adjustment_result['adjusted_score'],
+                    'polarity': round(adjusted_polarity, 3),  # -1 to +1 scale
+                    'original_label': adjustment_result['original_label'],
+                    'original_score': adjustment_result['original_score'],
+                    'original_polarity': round(original_polarity, 3),
+                    'adjustment_reason': adjustment_result.get('adjustment_reason', ''),
+                }
+                logger.info(f"[SENTIMENT] Rule-Adjusted: {adjustment_result['original_label']}({adjustment_result['original_score']:.3f}) → {adjustment_result['adjusted_label']}({adjustment_result['adjusted_score']:.3f})")
+                logger.debug(f"[SENTIMENT] Full result: {sentiment}")
+                return sentiment
+            except Exception:
+                logger.exception("Sentiment adjustment failed, using raw sentiment")
+                # Fallback: convert raw sentiment to polarity
+                polarity = self._convert_to_polarity(
+                    raw_sentiment.get('label', 'neutral'),
+                    raw_sentiment.get('score', 0.5)
+                )
+                raw_sentiment['polarity'] = round(polarity, 3)
+                return raw_sentiment
+        
+        # No adjustment, just convert raw sentiment to polarity
+        if raw_sentiment:
+            polarity = self._convert_to_polarity(
+                raw_sentiment.get('label', 'neutral'),
+                raw_sentiment.get('score', 0.5)
+            )
+            raw_sentiment['polarity'] = round(polarity, 3)
+            logger.info(f"[SENTIMENT] Final (no adjustment): {raw_sentiment.get('label')}({raw_sentiment.get('score'):.3f}) polarity={polarity:.3f}")
+        return raw_sentiment
+    
+    def _topics_from_zero_shot(self, zs: Dict[str, Any]) -> List[str]:
+        labels = zs.get("labels", [])
+        scores = zs.get("scores", [])
+        # Keep labels with score > 0.35
+        topics = [l for l, s in zip(labels, scores) if s >= 0.35]
+        return topics[:5]
+    
+    def _merge_ner_entities(self, entities_map: Dict[str, Dict[str, Any]], ner_results: List[Dict[str, Any]]) -> None:
+        for ent in ner_results:
+            entity_text = ent.get("word", "")
+            entity_key = entity_text.lower().strip()
+            if entity_key and entity_key not in entities_map:
+                entities_map[entity_key] = {
+                    "text": entity_text,
+                    "label": ent.get("entity_group", "UNKNOWN"),
+                    "start": ent.get("start"),
+                    "end": ent.get("end"),
+                    "confidence": float(ent.get("score", 0.0)),
+                    "type": "transformer_ner",
+                }
+    
+    def _merge_spacy_entities(self, entities_map: Dict[str, Dict[str, Any]], doc) -> None:
+        for ent in doc.ents:
+            entity_key = ent.text.lower().strip()
+            if entity_key and entity_key not in entities_map:
+                entities_map[entity_key] = {
+                    "text": ent.text,
+                    "label": ent.label_,
+                    "start": ent.start_char,
+                    "end": ent.end_char,
+                    "confidence": 0.9,
+                    "type": "spacy_ner",
+                }
+        
+        # Gazetteer phrase matches
+        if self._phrase_matcher is not None:
+            matches = self._phrase_matcher(doc)
+            for mid, start, end in matches:
+                span = doc[start:end]
+                entity_key = span.text.lower().strip()
+                entities_map[entity_key] = {
+                    "text": span.text,
+                    "label": self._spacy_nlp.vocab.strings[mid],
+                    "start": span.start_char,
+                    "end": span.end_char,
+                    "confidence": 1.0,
+                    "type": "gazetteer",
+                }
+    
     def analyze(self, text: str, language: Optional[str] = None) -> Dict[str, Any]:
         """
         Run sentiment, topic classification, and entity extraction.
@@ -271,9 +376,8 @@ class NLPModel:
         # Indian languages (hi, kn, ta, te, bn, gu, mr, pa, ml, or, ur) -> IndicBERT
         # Other/Unknown -> XLM-RoBERTa (fallback)
         
-        indian_languages = ['hi', 'kn', 'ta', 'te', 'bn', 'gu', 'mr', 'pa', 'ml', 'or', 'ur', 'as']
         use_english_model = language and language == 'en'
-        use_indicbert = language and language in indian_languages
+        use_indicbert = language and language in INDIAN_LANGUAGES
         
         raw_sentiment = None
         
@@ -321,58 +425,8 @@ class NLPModel:
             except Exception as e:
                 logger.exception(f"Sentiment inference failed: {e}")
         
-        # Apply rule-based sentiment adjuster if enabled
-        if raw_sentiment and settings.RULE_BASED_ADJUSTER_ENABLED:
-            try:
-                adjuster = get_sentiment_adjuster(settings.SENTIMENT_BOOST_THRESHOLD)
-                adjustment_result = adjuster.adjust_sentiment(
-                    text,
-                    raw_sentiment.get('label', 'neutral').lower(),
-                    raw_sentiment.get('score', 0.5)
-                )
-                
-                # Convert to polarity scale [-1, +1]
-                adjusted_polarity = self._convert_to_polarity(
-                    adjustment_result['adjusted_label'],
-                    adjustment_result['adjusted_score']
-                )
-                original_polarity = self._convert_to_polarity(
-                    adjustment_result['original_label'],
-                    adjustment_result['original_score']
-                )
-                
-                # Update result with adjusted sentiment including polarity
-                result["sentiment"] = {
-                    'label': adjustment_result['adjusted_label'],
-                    'score': adjustment_result['adjusted_score'],
-                    'polarity': round(adjusted_polarity, 3),  # -1 to +1 scale
-                    'original_label': adjustment_result['original_label'],
-                    'original_score': adjustment_result['original_score'],
-                    'original_polarity': round(original_polarity, 3),
-                    'adjustment_reason': adjustment_result.get('adjustment_reason', ''),
-                }
-                logger.info(f"[SENTIMENT] Rule-Adjusted: {adjustment_result['original_label']}({adjustment_result['original_score']:.3f}) → {adjustment_result['adjusted_label']}({adjustment_result['adjusted_score']:.3f})")
-                logger.debug(f"[SENTIMENT] Full result: {result['sentiment']}")
-            except Exception:
-                logger.exception("Sentiment adjustment failed, using raw sentiment")
-                # Fallback: convert raw sentiment to polarity
-                if raw_sentiment:
-                    polarity = self._convert_to_polarity(
-                        raw_sentiment.get('label', 'neutral'),
-                        raw_sentiment.get('score', 0.5)
-                    )
-                    raw_sentiment['polarity'] = round(polarity, 3)
-                result["sentiment"] = raw_sentiment
-        else:
-            # No adjustment, just convert raw sentiment to polarity
-            if raw_sentiment:
-                polarity = self._convert_to_polarity(
-                    raw_sentiment.get('label', 'neutral'),
-                    raw_sentiment.get('score', 0.5)
-                )
-                raw_sentiment['polarity'] = round(polarity, 3)
-                logger.info(f"[SENTIMENT] Final (no adjustment): {raw_sentiment.get('label')}({raw_sentiment.get('score'):.3f}) polarity={polarity:.3f}")
-            result["sentiment"] = raw_sentiment
+        # Apply rule-based sentiment adjuster (if enabled) and add polarity
+        result["sentiment"] = self._finalize_sentiment(text, raw_sentiment)
         
         # PERFORMANCE: Cache the sentiment result
         if result["sentiment"] and not cached_sentiment:
@@ -386,11 +440,7 @@ class NLPModel:
                     candidate_labels=settings.TOPIC_LABELS,
                     multi_label=True,
                 )
-                labels = zs.get("labels", [])
-                scores = zs.get("scores", [])
-                # Keep labels with score > 0.35
-                topics = [l for l, s in zip(labels, scores) if s >= 0.35]
-                result["topics"] = topics[:5]
+                result["topics"] = self._topics_from_zero_shot(zs)
                 logger.debug(f"Topics: {result['topics']}")
             except Exception:
                 logger.exception("Zero-shot topic inference failed")
@@ -401,18 +451,7 @@ class NLPModel:
         if self._ner_pipe is not None:
             try:
                 ner_results = self._ner_pipe(text[:settings.MAX_LENGTH])
-                for ent in ner_results:
-                    entity_text = ent.get("word", "")
-                    entity_key = entity_text.lower().strip()
-                    if entity_key and entity_key not in entities_map:
-                        entities_map[entity_key] = {
-                            "text": entity_text,
-                            "label": ent.get("entity_group", "UNKNOWN"),
-                            "start": ent.get("start"),
-                            "end": ent.get("end"),
-                            "confidence": float(ent.get("score", 0.0)),
-                            "type": "transformer_ner",
-                        }
+                self._merge_ner_entities(entities_map, ner_results)
                 logger.debug(f"Transformer NER found {len(ner_results)} entities")
             except Exception:
                 logger.exception("Transformer NER failed")
@@ -421,32 +460,7 @@ class NLPModel:
         if self._spacy_nlp and self._spacy_nlp is not False:
             try:
                 doc = self._spacy_nlp(text)
-                for ent in doc.ents:
-                    entity_key = ent.text.lower().strip()
-                    if entity_key and entity_key not in entities_map:
-                        entities_map[entity_key] = {
-                            "text": ent.text,
-                            "label": ent.label_,
-                            "start": ent.start_char,
-                            "end": ent.end_char,
-                            "confidence": 0.9,
-                            "type": "spacy_ner",
-                        }
-                
-                # Gazetteer phrase matches
-                if self._phrase_matcher is not None:
-                    matches = self._phrase_matcher(doc)
-                    for mid, start, end in matches:
-                        span = doc[start:end]
-                        entity_key = span.text.lower().strip()
-                        entities_map[entity_key] = {
-                            "text": span.text,
-                            "label": self._spacy_nlp.vocab.strings[mid],
-                            "start": span.start_char,
-                            "end": span.end_char,
-                            "confidence": 1.0,
-                            "type": "gazetteer",
-                        }
+                self._merge_spacy_entities(entities_map, doc)
                 logger.debug(f"spaCy/Gazetteer found {len(entities_map)} total entities")
             except Exception:
                 logger.exception("spaCy/gazetteer entity extraction failed")
@@ -461,116 +475,119 @@ class NLPModel:
     
     def analyze_batch(self, texts: List[str], languages: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
-        PERFORMANCE: Batch analyze multiple texts for 4x speedup
+        Batched equivalent of analyze(): one pipeline call per model instead of one per text.
+        
+        Texts are grouped by sentiment route (Cardiff RoBERTa / IndicBERT / multilingual)
+        so each group runs through a single model with batch_size=settings.BATCH_SIZE.
         
         Args:
             texts: List of texts to analyze
             languages: Optional list of language codes (same length as texts)
         
         Returns:
-            List of analysis results
+            List of analysis results, in input order
         """
         if not texts:
             return []
-        
         if languages is None:
             languages = [None] * len(texts)
         
-        results = []
-        
-        # Check cache for all texts first
-        cached_results = []
-        uncached_indices = []
-        uncached_texts = []
-        uncached_langs = []
-        
-        for i, (text, lang) in enumerate(zip(texts, languages)):
-            cached = nlp_cache.get_sentiment(text)
+        results: List[Dict[str, Any]] = [
+            {"sentiment": None, "topics": [], "entities": []} for _ in texts
+        ]
+        todo = [i for i, text in enumerate(texts) if text]
+        if not todo:
+            return results
+        
+        self._ensure_loaded()
+        batch_size = settings.BATCH_SIZE
+        truncated = {i: texts[i][:settings.MAX_LENGTH] for i in todo}
+        
+        # Sentiment: cache first, then one batch per model
+        pending = []
+        for i in todo:
+            cached = nlp_cache.get_sentiment(texts[i])
             if cached:
-                cached_results.append((i, cached))
+                results[i]["sentiment"] = cached
             else:
-                uncached_indices.append(i)
-                uncached_texts.append(text)
-                uncached_langs.append(lang)
-        
-        logger.info(f"[BATCH] Cache: {len(cached_results)} hits, {len(uncached_texts)} misses")
+                pending.append(i)
+        logger.info(f"[BATCH] Cache: {len(todo) - len(pending)} hits, {len(pending)} misses")
+        
+        raw: Dict[int, Dict[str, Any]] = {}
+        english = [i for i in pending if languages[i] == 'en']
+        indian = [i for i in pending if languages[i] in INDIAN_LANGUAGES]
+        routes = []
+        if english:
+            self._ensure_english_sentiment()
+            routes.append(("Cardiff RoBERTa", self._english_sentiment_pipe, english))
+        if indian:
+            self._ensure_muril_sentiment()
+            routes.append(("IndicBERT", self._muril_sentiment_pipe, indian))
+        for name, pipe, idxs in routes:
+            if not pipe:
+                continue
+            try:
+                logger.info(f"[BATCH] Processing {len(idxs)} texts with {name}")
+                outs = pipe([truncated[i] for i in idxs], batch_size=batch_size)
+                raw.update(zip(idxs, outs))
+            except Exception as e:
+                logger.exception(f"[BATCH] {name} sentiment failed: {e}, falling back to multilingual model")
         
-        # Batch process uncached texts
-        batch_sentiments = []
-        if uncached_texts:
-            self._ensure_loaded()
-            
-            # Batch sentiment analysis
+        # Anything left (other languages, unavailable or failed models) -> multilingual model
+        rest = [i for i in pending if i not in raw]
+        if rest and self._sentiment_pipe is not None:
             try:
-                # Truncate all texts
-                truncated = [t[:settings.MAX_LENGTH] for t in uncached_texts]
-                
-                # Determine which model to use based on languages
-                english_count = sum(1 for lang in uncached_langs if lang == 'en')
-                indian_count = sum(1 for lang in uncached_langs if lang in ['hi', 'kn', 'ta', 'te', 'bn', 'gu', 'mr', 'pa', 'ml', 'or', 'ur', 'as'])
-                
-                # Use the most common model for batch processing
-                if english_count > len(uncached_texts) / 2:
-                    self._ensure_english_sentiment()
-                    if self._english_sentiment_pipe and self._english_sentiment_pipe is not False:
-                        logger.info(f"[BATCH] Processing {len(uncached_texts)} texts with Cardiff RoBERTa")
-                        batch_sentiments = self._english_sentiment_pipe(truncated)
-                elif indian_count > len(uncached_texts) / 2:
-                    self._ensure_muril_sentiment()
-                    if self._muril_sentiment_pipe and self._muril_sentiment_pipe is not False:
-                        logger.info(f"[BATCH] Processing {len(uncached_texts)} texts with IndicBERT")
-                        batch_sentiments = self._muril_sentiment_pipe(truncated)
-                
-                # Fallback to multilingual
-                if not batch_sentiments and self._sentiment_pipe:
-                    logger.info(f"[BATCH] Processing {len(uncached_texts)} texts with multilingual model")
-                    batch_sentiments = self._sentiment_pipe(truncated)
-                
-                # Cache results
-                for text, sentiment in zip(uncached_texts, batch_sentiments):
-                    if sentiment:
-                        # Normalize and add polarity
-                        normalized = self._normalize_sentiment_output(sentiment)
-                        polarity = self._convert_to_polarity(
-                            normalized.get('label', 'neutral'),
-                            normalized.get('score', 0.5)
-                        )
-                        normalized['polarity'] = round(polarity, 3)
-                        nlp_cache.set_sentiment(text, normalized)
-            
+                logger.info(f"[BATCH] Processing {len(rest)} texts with multilingual model")
+                outs = self._sentiment_pipe([truncated[i] for i in rest], batch_size=batch_size)
+                for i, out in zip(rest, outs):
+                    raw[i] = self._normalize_sentiment_output(out)
             except Exception as e:
                 logger.exception(f"[BATCH] Batch sentiment analysis failed: {e}")
-                # Fallback to individual analysis
-                batch_sentiments = [None] * len(uncached_texts)
-        
-        # Combine cached and newly analyzed results
-        all_results = [None] * len(texts)
-        
-        # Fill in cached results
-        for idx, cached in cached_results:
-            all_results[idx] = {
-                "sentiment": cached,
-                "topics": [],
-                "entities": [],
-            }
-        
-        # Fill in batch processed results
-        for idx, uncached_idx in enumerate(uncached_indices):
-            sentiment = batch_sentiments[idx] if idx < len(batch_sentiments) else None
+        
+        for i in pending:
+            sentiment = self._finalize_sentiment(texts[i], raw.get(i))
+            results[i]["sentiment"] = sentiment
             if sentiment:
-                normalized = self._normalize_sentiment_output(sentiment)
-                polarity = self._convert_to_polarity(
-                    normalized.get('label', 'neutral'),
-                    normalized.get('score', 0.5)
+                nlp_cache.set_sentiment(texts[i], sentiment)
+        
+        # Zero-shot topic classification
+        if self._zero_shot_pipe is not None:
+            try:
+                outs = self._zero_shot_pipe(
+                    [truncated[i] for i in todo],
+                    candidate_labels=settings.TOPIC_LABELS,
+                    multi_label=True,
+                    batch_size=batch_size,
                 )
-                normalized['polarity'] = round(polarity, 3)
-            all_results[uncached_idx] = {
-                "sentiment": sentiment or None,
-                "topics": [],
-                "entities": [],
-            }
-        
-        return all_results
+                for i, zs in zip(todo, outs):
+                    results[i]["topics"] = self._topics_from_zero_shot(zs)
+            except Exception:
+                logger.exception("[BATCH] Zero-shot topic inference failed")
+        
+        # Entities: transformer NER, then spaCy + gazetteers
+        entity_maps: Dict[int, Dict[str, Dict[str, Any]]] = {i: {} for i in todo}
+        if self._ner_pipe is not None:
+            try:
+                outs = self._ner_pipe([truncated[i] for i in todo], batch_size=batch_size)
+                for i, ner_results in zip(todo, outs):
+                    self._merge_ner_entities(entity_maps[i], ner_results)
+            except Exception:
+                logger.exception("[BATCH] Transformer NER failed")
+        if self._spacy_nlp and self._spacy_nlp is not False:
+            try:
+                docs = self._spacy_nlp.pipe([texts[i] for i in todo], batch_size=batch_size)
+                for i, doc in zip(todo, docs):
+                    self._merge_spacy_entities(entity_maps[i], doc)
+            except Exception:
+                logger.exception("[BATCH] spaCy/gazetteer entity extraction failed")
+        
+        for i in todo:
+            entities = list(entity_maps[i].values())
+            if languages[i] and languages[i] != 'en':
+                entities = self._normalize_regional_entities(entities, languages[i])
+            results[i]["entities"] = entities
+        
+        return results
     
     def _normalize_regional_entities(self, entities: List[Dict[str, Any]], language: str) -> List[Dict[str, Any]]:
         """Normalize regional language entity names to English equivalents."""
@@ -591,9 +608,3 @@ class NLPModel:
         except Exception as e:
             logger.exception(f"Regional entity normalization failed: {e}")
             return entities
-    
-    def analyze_batch(self, texts: List[str], languages: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        """Batch processing for better performance."""
-        if languages:
-            return [self.analyze(text, language=lang) for text, lang in zip(texts, languages)]
-        return [self.analyze(text) for text in texts]
@@ -30,7 +30,7 @@ except ImportError:
 
 from .database import Article, get_database
 from .config import settings
-from .language_processor import MultilingualProcessor
+from .language_processor import get_language_processor
 
 
 class RAGAssistant:
@@ -59,7 +59,7 @@ class RAGAssistant:
         os.makedirs(cache_dir, exist_ok=True)
         
         # Initialize translation service for multilingual support
-        self.translator = MultilingualProcessor()
+        self.translator = get_language_processor()
         
         # Initialize embeddings
         if use_openai and OPENAI_AVAILABLE and os.getenv("OPENAI_API_KEY"):
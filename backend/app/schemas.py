@@ -313,6 +313,30 @@ class NewsListResponse(BaseModel):
     total: int
 
 
+class ArticleSummaryOut(BaseModel):
+    """List/feed view of an article: the ARTICLE_SUMMARY_COLUMNS only (no content or entities)"""
+    id: str
+    url: str
+    title: str
+    summary: Optional[str] = None
+    source: Optional[str] = None
+    region: Optional[str] = None
+    language: Optional[str] = None
+    published_at: Optional[datetime] = None
+    sentiment_label: Optional[str] = None
+    sentiment_score: Optional[float] = None
+    content_category: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class LatestNewsResponse(BaseModel):
+    items: List[ArticleSummaryOut]
+    total: int
+    timestamp: str
+
+
 class AnalyticsBucket(BaseModel):
     key: str = Field(..., alias="label", description="Alias for uniformity when needed")
     count: int
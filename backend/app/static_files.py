@@ -0,0 +1,103 @@
+"""
+Static file serving for the built frontend with an in-memory cache
+Small assets are read once and kept (with a gzipped copy for text types);
+conditional requests are answered with 304 by Starlette's ETag handling
+"""
+from __future__ import annotations
+import gzip
+import os
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+# Files larger than this are streamed from disk as usual
+STATIC_CACHE_MAX_FILE_BYTES = 1024 * 1024
+STATIC_CACHE_MAX_ENTRIES = 1024
+
+# Only compress text-like assets of at least this size
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 6
+_COMPRESSIBLE_TYPES = (
+    "text/",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "image/svg+xml",
+)
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that serves small files from memory, keyed by path + mtime + size"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # full_path -> ((mtime_ns, size), body, gzipped body or None)
+        self._cache: "OrderedDict[str, Tuple[Tuple[int, int], bytes, Optional[bytes]]]" = OrderedDict()
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        # 304s, HEAD requests and large files keep Starlette's behaviour
+        if (
+            response.status_code != 200
+            or scope["method"] != "GET"
+            or stat_result.st_size > STATIC_CACHE_MAX_FILE_BYTES
+        ):
+            return response
+
+        body, gzipped = self._load(str(full_path), stat_result, response.media_type or "")
+
+        request_headers = Headers(scope=scope)
+        headers = dict(response.headers)
+        headers.pop("content-length", None)
+        headers.pop("accept-ranges", None)
+        if gzipped is not None:
+            headers["vary"] = "Accept-Encoding"
+            if "gzip" in request_headers.get("accept-encoding", ""):
+                headers["content-encoding"] = "gzip"
+                body = gzipped
+                # The gzip body is a different representation, so it needs its own ETag;
+                # Starlette only checked the plain one, so revalidation is answered here
+                if "etag" in headers:
+                    headers["etag"] = _gzip_etag(headers["etag"])
+                    if self.is_not_modified(Headers(headers), request_headers):
+                        return NotModifiedResponse(headers)
+        return Response(body, status_code=status_code, headers=headers)
+
+    def is_not_modified(self, response_headers: Headers, request_headers: Headers) -> bool:
+        # Match ETag lists and weak (W/) validators in If-None-Match the way
+        # newer Starlette does; this version only compares the raw header
+        if_none_match = request_headers.get("if-none-match")
+        etag = response_headers.get("etag")
+        if if_none_match and etag and etag in [tag.strip(" W/") for tag in if_none_match.split(",")]:
+            return True
+        return super().is_not_modified(response_headers, request_headers)
+
+    def _load(self, full_path: str, stat_result: os.stat_result, media_type: str) -> Tuple[bytes, Optional[bytes]]:
+        version = (stat_result.st_mtime_ns, stat_result.st_size)
+        entry = self._cache.get(full_path)
+        if entry is not None and entry[0] == version:
+            self._cache.move_to_end(full_path)
+            return entry[1], entry[2]
+
+        with open(full_path, "rb") as f:
+            body = f.read()
+        gzipped = None
+        if len(body) >= GZIP_MIN_BYTES and media_type.startswith(_COMPRESSIBLE_TYPES):
+            gzipped = gzip.compress(body, GZIP_LEVEL)
+
+        self._cache[full_path] = (version, body, gzipped)
+        self._cache.move_to_end(full_path)
+        if len(self._cache) > STATIC_CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+        return body, gzipped
+
+
+def _gzip_etag(etag: str) -> str:
+    """Derive the gzip variant's ETag, keeping the quotes inside (e.g. "abc" -> "abc-gzip")"""
+    if etag.endswith('"'):
+        return etag[:-1] + '-gzip"'
+    return etag + "-gzip"
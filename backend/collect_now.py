@@ -15,3 +15,4 @@ result = collector.collect_once()
 print(f"\n✓ Collection complete!")
 print(f"  Created: {result.get('created', 0)}")
 print(f"  Updated: {result.get('updated', 0)}")
+print(f"  Skipped (already stored): {result.get('skipped', 0)}")
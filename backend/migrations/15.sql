@@ -0,0 +1,17 @@
+-- Migration 15: Composite indexes matching the list_articles hot path
+-- Every /news request filters on should_show_pib + content_category and
+-- orders by published_at DESC NULLS LAST, collected_at DESC. The partial
+-- index below serves that filter and sort with a single ordered index scan.
+
+CREATE INDEX IF NOT EXISTS idx_articles_pib_gov_pub
+ON articles(published_at DESC NULLS LAST, collected_at DESC)
+WHERE should_show_pib = TRUE AND content_category = 'Government';
+
+-- Language-filtered listings (language OR detected_language = X)
+CREATE INDEX IF NOT EXISTS idx_articles_language_pub
+ON articles(language, published_at DESC NULLS LAST);
+
+CREATE INDEX IF NOT EXISTS idx_articles_detected_language_pub
+ON articles(detected_language, published_at DESC NULLS LAST);
+
+ANALYZE articles;
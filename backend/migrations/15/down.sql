@@ -0,0 +1,5 @@
+-- Rollback Migration 15: Remove list_articles composite indexes
+
+DROP INDEX IF EXISTS idx_articles_pib_gov_pub;
+DROP INDEX IF EXISTS idx_articles_language_pub;
+DROP INDEX IF EXISTS idx_articles_detected_language_pub;
@@ -0,0 +1,17 @@
+-- Migration 16: Full-text search vector for /news?q=
+-- Replaces the title/summary/content ILIKE '%q%' scan with an inverted
+-- index lookup. The 'simple' configuration does no stemming or stop-word
+-- removal, so it works the same for English and the Indic scripts.
+
+ALTER TABLE articles
+ADD COLUMN IF NOT EXISTS search_tsv TSVECTOR
+GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(summary, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(content, '')), 'C')
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_articles_search_tsv
+ON articles USING GIN (search_tsv);
+
+COMMENT ON COLUMN articles.search_tsv IS 'Weighted full-text vector of title (A), summary (B) and content (C)';
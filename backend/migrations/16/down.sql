@@ -0,0 +1,4 @@
+-- Rollback Migration 16: Remove full-text search vector
+
+DROP INDEX IF EXISTS idx_articles_search_tsv;
+ALTER TABLE articles DROP COLUMN IF EXISTS search_tsv;
@@ -0,0 +1,7 @@
+-- Migration 17: Partial GIN index for /analytics/category
+-- analytics_category unnests topic_labels of PIB-visible Government
+-- articles only; indexing just that slice keeps the index small.
+
+CREATE INDEX IF NOT EXISTS idx_articles_topic_labels_pib_gov
+ON articles USING GIN (topic_labels)
+WHERE should_show_pib = TRUE AND content_category = 'Government';
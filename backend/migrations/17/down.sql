@@ -0,0 +1,3 @@
+-- Rollback Migration 17: Remove partial topic_labels GIN index
+
+DROP INDEX IF EXISTS idx_articles_topic_labels_pib_gov;
@@ -0,0 +1,8 @@
+-- Migration 18: Drop indexes made redundant by the hash-only upsert
+-- upsert_article now resolves duplicates with ON CONFLICT (hash), which
+-- uses the UNIQUE (hash) constraint index. Nothing looks articles up by
+-- url any more, and idx_articles_hash duplicates the unique index, so
+-- both only add write cost to every upsert.
+
+DROP INDEX IF EXISTS idx_articles_url;
+DROP INDEX IF EXISTS idx_articles_hash;
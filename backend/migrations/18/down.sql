@@ -0,0 +1,7 @@
+-- Rollback Migration 18: Restore url and hash lookup indexes
+
+CREATE INDEX IF NOT EXISTS idx_articles_hash
+ON articles(hash);
+
+CREATE INDEX IF NOT EXISTS idx_articles_url
+ON articles(url);
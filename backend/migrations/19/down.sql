@@ -0,0 +1,7 @@
+-- Rollback Migration 19: Restore default autovacuum and fillfactor settings
+
+ALTER TABLE articles RESET (
+    autovacuum_vacuum_scale_factor,
+    autovacuum_analyze_scale_factor,
+    fillfactor
+);
@@ -0,0 +1,31 @@
+-- Migration 20: Daily geo rollup for the heat map
+-- get_heat_map_data aggregated every GoI article in the window on each
+-- call. geo_daily_agg keeps per (day, region, source) counts and sums, so
+-- the heat map becomes a range scan over a few rows per region-day.
+-- Averages are rebuilt as SUM(x_sum) / SUM(x_n); x_n counts non-null
+-- values so the result matches AVG(). source_name is coalesced to '' so
+-- the unique index (required by REFRESH ... CONCURRENTLY) covers every row.
+--
+-- The periodic collector refreshes the view after each run
+-- (Database.refresh_geo_rollup). With pg_cron it can be scheduled instead:
+--   SELECT cron.schedule('refresh-geo-daily-agg', '0 * * * *',
+--       'REFRESH MATERIALIZED VIEW CONCURRENTLY geo_daily_agg');
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS geo_daily_agg AS
+SELECT
+    detected_region,
+    date_trunc('day', created_at) AS day,
+    COALESCE(source_name, '') AS source_name,
+    COUNT(*) AS article_count,
+    SUM(confidence_score) AS confidence_sum,
+    COUNT(confidence_score) AS confidence_n,
+    SUM(sentiment_score) AS sentiment_sum,
+    COUNT(sentiment_score) AS sentiment_n
+FROM articles
+WHERE is_goi = TRUE
+  AND detected_region IS NOT NULL
+  AND detected_region != 'India'
+GROUP BY 1, 2, 3;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_geo_daily_agg_day_region_source
+ON geo_daily_agg(day, detected_region, source_name);
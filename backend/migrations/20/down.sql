@@ -0,0 +1,3 @@
+-- Rollback Migration 20: Drop the daily geo rollup
+
+DROP MATERIALIZED VIEW IF EXISTS geo_daily_agg;
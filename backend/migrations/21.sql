@@ -0,0 +1,16 @@
+-- Migration 21: Partial index for the geo intelligence aggregates
+-- Every GeoIntelligence query filters GoI articles with a detected state
+-- (is_goi, detected_region not null / not 'India') over a created_at
+-- window, then groups by detected_region. Indexing only that slice keeps
+-- the index small and turns those scans into index range scans.
+-- The scheme / ministry filters use the existing GIN indexes from
+-- migration 12 (idx_articles_goi_schemes, idx_articles_goi_ministries)
+-- now that they are written as array containment (@>).
+
+CREATE INDEX IF NOT EXISTS idx_articles_goi_region_created
+ON articles(detected_region, created_at DESC)
+WHERE is_goi = TRUE
+  AND detected_region IS NOT NULL
+  AND detected_region <> 'India';
+
+ANALYZE articles;
@@ -0,0 +1,3 @@
+-- Rollback Migration 21: Drop the geo intelligence partial index
+
+DROP INDEX IF EXISTS idx_articles_goi_region_created;